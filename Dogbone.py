@@ -12,19 +12,14 @@
 # The add-in will then create a dogbone with diameter equal to the tool diameter plus
 # twice the offset (as the offset is applied to the radius) at each selected edge.
 import os
-import sys
 
 import adsk.core
 import adsk.fusion
 
-_appPath = os.path.dirname(os.path.abspath(__file__))
-_subpath = os.path.join(f"{_appPath}", "py_packages")
-
-if _subpath not in sys.path:
-    sys.path.insert(0, _subpath)
-    
 from . import commands
 
+_appPath = os.path.dirname(os.path.abspath(__file__))
+
 CONFIG_PATH = os.path.join(_appPath, "defaults.dat")
 
 # noinspection PyMethodMayBeStatic
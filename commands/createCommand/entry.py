@@ -6,7 +6,6 @@ import logging
 
 import adsk.core
 import adsk.fusion
-import logging
     
 from ...lib.classes import DbParams, Selection, params
 
@@ -14,15 +13,12 @@ from ...lib.common.log import startLogger, stopLogger
 
 import time
 from ...lib.utils import eventHandler, messageBox
-from .main import createStaticDogbones
 from ... import config
 
 # logger = logging.getLogger('dogbone')
 
 appPath = os.path.dirname(os.path.abspath(__file__))
 
-ICON_FOLDER = os.path.join(appPath, 'resources', '')
-
 # TODO *** Specify the command identity information. ***
 CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdDialog'
 CMD_NAME = 'Dogbones'
@@ -40,7 +36,7 @@ PANEL_ID = 'SolidCreatePanel'
 COMMAND_BESIDE_ID = ''
 
 # Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
+ICON_FOLDER = os.path.join(appPath, 'resources', '')
 
 logger = logging.getLogger('dogbone.createCommand')
 
@@ -100,7 +96,7 @@ def stop():
 
 @eventHandler(handler_cls=adsk.core.CommandCreatedEventHandler)
 def onCreate( args: adsk.core.CommandCreatedEventArgs):
-    from ...lib.classes import DogboneUi  #need to import main classes and functions here - to prevent InvalidDocument Error on start-up
+    from ...lib.classes.DogboneUi import DogboneUi  #need to import main classes and functions here - to prevent InvalidDocument Error on start-up
     
     app = adsk.core.Application.get()
     design: adsk.fusion.Design = app.activeProduct
@@ -122,12 +118,13 @@ def onCreate( args: adsk.core.CommandCreatedEventArgs):
     ui = DogboneUi(params, cmd, createDogbones)
 
 def createDogbones( params: DbParams, selection: Selection):
+    from .main import createStaticDogbones  #only needed once the user runs the command - kept out of add-in start-up
     logger = logging.getLogger('dogbone.createDogbones')
     app = adsk.core.Application.get()
     ui = app.userInterface
 
 
-    start = time.time()
+    start = time.perf_counter() if params.benchmark else None
 
     createStaticDogbones(params, selection)
 
@@ -141,5 +138,5 @@ def createDogbones( params: DbParams, selection: Selection):
 
     if params.benchmark:
         messageBox(
-            f"Benchmark: {time.time() - start:.02f} sec processing {len(selection.edges)} edges"
+            f"Benchmark: {time.perf_counter() - start:.02f} sec processing {len(selection.edges)} edges"
         )
\ No newline at end of file
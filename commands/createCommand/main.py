@@ -3,7 +3,7 @@ import json
 import adsk.core
 import adsk.fusion
 
-from ...lib.utils import debugFace, getTopFace 
+from ...lib.utils import debugFace, getTopFace, unionBodies
 from ...lib.classes import DbParams, Selection, groupContext 
 
 from ...lib.common.log import logging
@@ -16,37 +16,29 @@ def createStaticDogbones(param: DbParams, selection: Selection):
 
     logger.info("Creating static dogbones")
 
-    tempBrepMgr = adsk.fusion.TemporaryBRepManager.get()
-
     for occurrenceFaces in selection.selectedOccurrences.values():
         with groupContext():
             topFace = None
-            toolBodies = None
+            toolBodies = []
 
             if param.fromTop:
                 topFace, topFaceRefPoint = getTopFace(occurrenceFaces[0].native)
-                logger.debug(f"topFace ref point: {topFaceRefPoint.asArray()}")
-                logger.info(f"Processing holes from top face - {topFace.tempId}")
+                # the messages read geometry from Fusion - only build them when they'll be written
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"topFace ref point: {topFaceRefPoint.asArray()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Processing holes from top face - {topFace.tempId}")
                 debugFace(topFace)
 
             for occurrenceFace in occurrenceFaces:
                 component = occurrenceFace.component
                 occurrenceFace.save()
-                toolCollection = adsk.core.ObjectCollection.create()
 
                 for edgeObj in occurrenceFace.selectedEdges:
                     edgeObj.save()
-                    if not toolBodies:
-                        toolBodies = edgeObj.getToolBody(
-                            topFace=topFace
-                        )
-                    else:
-                        tempBrepMgr.booleanOperation(
-                            toolBodies,
-                            edgeObj.getToolBody(
-                                topFace=topFace),
-                            adsk.fusion.BooleanTypes.UnionBooleanType,
-                        )
+                    toolBodies.append(edgeObj.getToolBody(topFace=topFace))
+
+            toolBodies = unionBodies(toolBodies)
 
             targetBody: adsk.fusion.BRepBody = occurrenceFace.body
             baseFeatures: adsk.fusion.BaseFeature = component.features.baseFeatures
@@ -66,24 +58,30 @@ def createStaticDogbones(param: DbParams, selection: Selection):
 
             bodies = {face.body.name:face.body for face in occurrenceFaces} #This is just a quickish way of creating of unique set of bodies - body names within the same component are unique!
 
-            for val, targetBody in enumerate(bodies.values()):
-                baseFeature.attributes.add(groupName=DB_GROUP,
-                                    name="basefeature:",
-                                    value=json.dumps(faces))
+            baseFeature.attributes.add(groupName=DB_GROUP,
+                                name="basefeature:",
+                                value=json.dumps(faces))
 
-                [toolCollection.add(body) for body in baseFeature.bodies]  #add baseFeature bodies into toolCollection
+            toolCollection = adsk.core.ObjectCollection.create()
+            for body in baseFeature.bodies:  #add baseFeature bodies into toolCollection
+                toolCollection.add(body)
 
-                combineFeatureInput = component.features.combineFeatures.createInput(
+            combineFeatures = component.features.combineFeatures
+            lastBody = len(bodies) - 1
+
+            for val, targetBody in enumerate(bodies.values()):
+                combineFeatureInput = combineFeatures.createInput(
                     targetBody=targetBody,
                     toolBodies=toolCollection
                 )
 
-                combineFeatureInput.isKeepToolBodies = val != len(bodies)-1  #This is a bit of a work around - you want to keep tool bodies = True until the last body is processed.
+                combineFeatureInput.isKeepToolBodies = val != lastBody  #This is a bit of a work around - you want to keep tool bodies = True until the last body is processed.
                 combineFeatureInput.isNewComponent = False
                 combineFeatureInput.operation = (
                     adsk.fusion.FeatureOperations.CutFeatureOperation
                 )
-                combine:adsk.fusion.CombineFeature = component.features.combineFeatures.add(combineFeatureInput)
+                combine:adsk.fusion.CombineFeature = combineFeatures.add(combineFeatureInput)
 
-            logger.debug(f"combine: {combine.name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"combine: {combine.name}")
 
@@ -19,8 +19,6 @@ ui = app.userInterface
 
 appPath = os.path.dirname(os.path.abspath(__file__))
 
-ICON_FOLDER = os.path.join(appPath, 'resources', '')
-
 # TODO *** Specify the command identity information. ***
 CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdDialog'
 
@@ -37,7 +35,7 @@ PANEL_ID = 'SolidCreatePanel'
 COMMAND_BESIDE_ID = ''
 
 # Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
+ICON_FOLDER = os.path.join(appPath, 'resources', '')
 
 
 def start():
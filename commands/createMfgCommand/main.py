@@ -4,7 +4,7 @@ import json
 import adsk.core
 import adsk.fusion
 
-from ...lib.utils import debugFace, getTopFace 
+from ...lib.utils import debugFace, getTopFace, unionBodies
 from ...lib.classes import DbParams, Selection, groupContext 
 
 from ...lib.common.log import logging
@@ -15,37 +15,29 @@ def createStaticDogbones(param: DbParams, selection: Selection):
 
     logger.info("Creating static dogbones")
 
-    tempBrepMgr = adsk.fusion.TemporaryBRepManager.get()
-
     for occurrenceFaces in selection.selectedOccurrences.values():
         with groupContext():
             topFace = None
-            toolBodies = None
+            toolBodies = []
 
             if param.fromTop:
                 topFace, topFaceRefPoint = getTopFace(occurrenceFaces[0].native)
-                logger.debug(f"topFace ref point: {topFaceRefPoint.asArray()}")
-                logger.info(f"Processing holes from top face - {topFace.tempId}")
+                # the messages read geometry from Fusion - only build them when they'll be written
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"topFace ref point: {topFaceRefPoint.asArray()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Processing holes from top face - {topFace.tempId}")
                 debugFace(topFace)
 
             for selectedFace in occurrenceFaces:
                 component = selectedFace.component
                 selectedFace.save()
-                toolCollection = adsk.core.ObjectCollection.create()
 
                 for edgeObj in selectedFace.selectedEdges:
                     edgeObj.save()
-                    if not toolBodies:
-                        toolBodies = edgeObj.getToolBody(
-                            topFace=topFace
-                        )
-                    else:
-                        tempBrepMgr.booleanOperation(
-                            toolBodies,
-                            edgeObj.getToolBody(
-                                topFace=topFace),
-                            adsk.fusion.BooleanTypes.UnionBooleanType,
-                        )
+                    toolBodies.append(edgeObj.getToolBody(topFace=topFace))
+
+            toolBodies = unionBodies(toolBodies)
 
             targetBody: adsk.fusion.BRepBody = selectedFace.body
             baseFeatures: adsk.fusion.BaseFeature = component.features.baseFeatures
@@ -65,9 +57,12 @@ def createStaticDogbones(param: DbParams, selection: Selection):
                                 name="basefeature:",
                                 value=json.dumps(faces))
 
-            [toolCollection.add(body) for body in baseFeature.bodies]  #add baseFeature bodies into toolCollection
+            toolCollection = adsk.core.ObjectCollection.create()
+            for body in baseFeature.bodies:  #add baseFeature bodies into toolCollection
+                toolCollection.add(body)
 
-            combineFeatureInput = component.features.combineFeatures.createInput(
+            combineFeatures = component.features.combineFeatures
+            combineFeatureInput = combineFeatures.createInput(
                 targetBody=targetBody,
                 toolBodies=toolCollection
             )
@@ -77,7 +72,8 @@ def createStaticDogbones(param: DbParams, selection: Selection):
             combineFeatureInput.operation = (
                 adsk.fusion.FeatureOperations.CutFeatureOperation
             )
-            combine:adsk.fusion.CombineFeature = component.features.combineFeatures.add(combineFeatureInput)
+            combine:adsk.fusion.CombineFeature = combineFeatures.add(combineFeatureInput)
 
-            logger.debug(f"combine: {combine.name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"combine: {combine.name}")
 
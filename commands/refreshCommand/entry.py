@@ -9,7 +9,6 @@ import adsk.fusion
 from ...lib.common.log import logging
 
 from ...lib.utils import eventHandler
-from .main import updateDogBones
 from ... import config
 from ...lib.classes import params
 
@@ -20,8 +19,6 @@ ui = app.userInterface
 
 appPath = os.path.dirname(os.path.abspath(__file__))
 
-ICON_FOLDER = os.path.join(appPath, 'resources', '')
-
 # TODO *** Specify the command identity information. ***
 CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_updCmd'
 CMD_NAME = 'Dogbone refresh'
@@ -39,7 +36,7 @@ PANEL_ID = 'SolidCreatePanel'
 COMMAND_BESIDE_ID = 'ScriptsManagerCommand'
 
 # Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
+ICON_FOLDER = os.path.join(appPath, 'resources', '')
 
 
 def start():
@@ -90,4 +87,5 @@ def stop():
 
 @eventHandler(handler_cls=adsk.core.CommandCreatedEventHandler)
 def onUpdate( args: adsk.core.CommandCreatedEventArgs):
+    from .main import updateDogBones  #only needed once the user runs the command - kept out of add-in start-up
     updateDogBones()
\ No newline at end of file
@@ -1,11 +1,12 @@
 import json
+from collections import defaultdict
 
 import adsk.core
 import adsk.fusion
 
-from ...lib.classes import DbFace, baseFeatureContext 
+from ...lib.classes import DbFace, baseFeatureContext, clearExpressionCache
 
-from ...lib.utils import getTopFace
+from ...lib.utils import getTopFace, unionBodies, clearCaches
 from ...constants import DB_GROUP
 
 
@@ -17,17 +18,22 @@ def updateDogBones():
     app = adsk.core.Application.get()
     design: adsk.fusion.Design = app.activeProduct 
     baseFeaturesAttrs: adsk.core.Attributes = design.findAttributes(DB_GROUP, "re:basefeature:.*")
+    clearCaches()
+    clearExpressionCache()  # user parameters, units or the active design may have changed since the last evaluation
+
+    # one design-wide search for face attributes, bucketed by face id, instead of a regex search per base feature
+    faceAttrsById = defaultdict(list)
+    for faceAtt in design.findAttributes(DB_GROUP, "re:face:.*"):
+        faceAttrsById[faceAtt.name[5:]].append(faceAtt)
 
     for bfAttr in baseFeaturesAttrs:
 
         baseFeature: adsk.fusion.BaseFeature = bfAttr.parent
         faces = json.loads(bfAttr.value)
-        faceList = '|'.join(map(str, faces))
-        regex = "re:face:("+faceList+")"
-        faceAttrs = g._design.findAttributes(DB_GROUP, regex)
+        faceAttrs = [faceAtt for faceId in faces for faceAtt in faceAttrsById.get(str(faceId), ())]
 
-        tempBrepMgr = adsk.fusion.TemporaryBRepManager.get()
-        toolBodies = None
+        toolBodies = []
+        topFaces = {}  # (body entityToken, face normal): native top face - faces of one base feature usually share both
         
         with baseFeatureContext(baseFeature= baseFeature):
             for faceAtt in faceAttrs:
@@ -35,19 +41,22 @@ def updateDogBones():
                     continue
                 selectedFace: DbFace = DbFace(face=faceAtt.parent,
                             restoreState=True)
-                topFace, _ = getTopFace(selectedFace=selectedFace.face)
-                topFace = topFace.nativeObject if topFace.nativeObject else topFace
+                # the top face depends on which way the selected face points - pockets cut from opposite
+                # sides of the same body have different top faces
+                topFaceKey = (
+                    selectedFace.face.body.entityToken,
+                    tuple(round(c, 6) for c in selectedFace.faceNormal.asArray()),
+                )
+                topFace = topFaces.get(topFaceKey)
+                if topFace is None:
+                    topFace, _ = getTopFace(selectedFace=selectedFace.face)
+                    topFace = topFaces[topFaceKey] = topFace.nativeObject if topFace.nativeObject else topFace
                 for edge in selectedFace.selectedEdges:
-                    if not toolBodies:
-                        toolBodies = edge.getToolBody(
-                            topFace=topFace
-                        )
-                    else:
-                        tempBrepMgr.booleanOperation(
-                            toolBodies,
-                            edge.getToolBody(topFace=topFace),
-                            adsk.fusion.BooleanTypes.UnionBooleanType,
-                        )
-                if toolBodies:
-                    [baseFeature.updateBody(body, toolBodies) for body in baseFeature.sourceBodies]
+                    toolBodies.append(edge.getToolBody(topFace=topFace))
+
+            # the base feature only needs updating once, with the union of every face's tools
+            toolBodies = unionBodies(toolBodies)
+            if toolBodies:
+                for body in baseFeature.sourceBodies:
+                    baseFeature.updateBody(body, toolBodies)
 
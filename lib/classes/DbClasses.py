@@ -1,31 +1,59 @@
 """Main dogbone classes - Face Entities, Edge Entities and class for keeping a register of entities that have been selected"""
 import logging
 import traceback
-from math import tan, pi
+from math import tan, pi, sqrt
 import json
-from typing import cast, Dict, List
+from collections import defaultdict
+from typing import Dict, List
 
 import adsk.core
 import adsk.fusion
 
 from .DbData import DbParams
-from ..common.errors import FaceInvalidError, EdgeInvalidError
+from ..common.errors import FaceInvalidError, EdgeInvalidError, DogboneTopologyError
 from ...constants import DB_GROUP, MORTISE_DOGBONE, MINIMAL_DOGBONE
-from ..utils import getFaceNormal, getEdgeVector, getAngleBetweenFaces, messageBox, getCornerEdgesAtFace, getTranslateVectorBetweenFaces, correctedEdgeVector, getTopFace
+from ..utils import getFaceNormal, getEdgeVector, getAngleBetweenFaces, messageBox, getCornerEdgesAtFace, getTranslateVectorBetweenFaces, correctedEdgeVector, getTopFace, getSideFaces, isLikelyCornerEdge
 logger = logging.getLogger("dogbone.DbClasses")
 
+_PLANE_CLASS_TYPE = adsk.core.Plane.classType()  # constant - avoids an API call per candidate edge face
+
 class Selection:
     def __init__(self) -> None:
 
         self.addingEdges: bool = False
 
-        self.selectedOccurrences = {}  # key hash(occurrence.entityToken) value:[DbFace,...]
+        self.selectedOccurrences: Dict[int, List["DbFace"]] = defaultdict(list)  # key hash(occurrence.entityToken) value:[DbFace,...]
         self.selectedFaces: Dict[int, "DbFace"] = {}
         self.selectedEdges: Dict[int, "DbEdge"] = {}
 
         self.edges: List[adsk.fusion.BRepEdge] = []
         self.faces: List[adsk.fusion.BRepFace] = []
 
+        self._selectedComponents = None  # built on first use after the face register changes
+
+    @property
+    def selectedComponents(self) -> List[adsk.fusion.Component]:
+        """Components of the occurrence faces that have been selected - root component faces aren't included"""
+        if self._selectedComponents is None:
+            self._selectedComponents = [
+                faceObj.face.assemblyContext.component
+                for faces in self.selectedOccurrences.values()
+                for faceObj in faces
+                if faceObj.face.assemblyContext
+            ]
+        return self._selectedComponents
+
+    def primaryFace(self, occurrenceId: int) -> "DbFace":
+        """First selected face registered against an occurrence (or root body) - None if there isn't one"""
+        return next(
+            (faceObj for faceObj in self.selectedOccurrences.get(occurrenceId, ()) if faceObj.isSelected),
+            None,
+        )
+
+    def facesChanged(self):
+        """Call after faces are added to or removed from selectedOccurrences"""
+        self._selectedComponents = None
+
 
 class DbFace:
     logger = logging.getLogger("dogbone.DbFace")
@@ -42,27 +70,30 @@ class DbFace:
         design: adsk.fusion.Design = app.activeProduct
         self.rootComp = design.rootComponent
         self.ui = app.userInterface
-        self.face = (
-            face if face.isValid else design.findEntityByToken(self._entityToken)[0]
-        )
-
-        self._native = face.nativeObject if face.nativeObject else self.face
 
         self._params = params
         self.selection = selection
         self._entityToken = face.entityToken
 
+        # validity and nativeObject are each read once - every access is a call into Fusion
         self.face = face = (
             face if face.isValid else design.findEntityByToken(self._entityToken)[0]
         )
+        nativeObject = face.nativeObject
+        self._native = nativeObject if nativeObject else face
 
         self._faceId = hash(self._entityToken)
         DbFace.logger.debug(f'FaceCreated: {self._faceId}')
-        self.faceNormal = getFaceNormal(face)
+        self.faceNormal = getFaceNormal(face, self._entityToken)
         self._refPoint = self._native.pointOnFace
         #     face.nativeObject.pointOnFace if face.nativeObject else face.pointOnFace
         # )
         self._component = face.body.parentComponent
+        assemblyContext = face.assemblyContext
+        # the face's occurrence (or root body) doesn't change - resolve its key once
+        self._occurrenceId = (
+            hash(assemblyContext.entityToken) if assemblyContext else hash(face.body.entityToken)
+        )
         self.commandInputsEdgeSelect = commandInputsEdgeSelect
         self._selected = True
         self._body = self._native.body #self.face.body.nativeObject if self.face.nativeObject else self.face.body
@@ -72,6 +103,9 @@ class DbFace:
             []
         )  # used for quick checking if an edge is already included (below)
         self._customGraphicGroup = None  #for future use
+        self._topFaceTranslation = None  # (topFace, (x, y, z)) - see translationTo
+        self._vertices = None  # native vertices - read on first use, then shared by all edges of the face
+        self._edgeIndex = None  # {tempId: native edge} - read on first use, then shared by all edges of the face
 
         self._restoreState = restoreState
 
@@ -85,18 +119,22 @@ class DbFace:
         #             this is where inside corner edges, dropping down from the face are processed
         # ==============================================================================
 
-        faceEdgesSet = {hash(edge.entityToken) for edge in self.face.edges}
+        faceEdgesSet = {edge.entityToken for edge in self.face.edges}
         faceVertices = [vertex for vertex in self.face.vertices]
-        allEdges = {}  #dict key:hash(entity code): BrepEdge
+        allEdges = {}  #dict key:entityToken: BrepEdge - each token is only fetched from Fusion once
 
         #populate allEdges dict with all edges associated with face vertices
         for vertex in faceVertices:
-            allEdges.update({hash(edge.entityToken): edge for edge in vertex.edges})
+            allEdges.update({edge.entityToken: edge for edge in vertex.edges})
 
-        candidateEdgesId = set(allEdges.keys()) - faceEdgesSet  #remove edges associated with face - just leaves corner edges
-        candidateEdges = [allEdges[edgeId] for edgeId in candidateEdgesId] #create list of corner edges
+        candidateTokens = allEdges.keys() - faceEdgesSet  #remove edges associated with face - just leaves corner edges
 
-        for edge in candidateEdges:
+        # cosines of the lowest and highest corner angle wanted - for the isLikelyCornerEdge prefilter
+        cosLow = self._params.cosMin if self._params.acuteAngle else 0.0
+        cosHigh = self._params.cosMax if self._params.obtuseAngle else 0.0
+
+        for entityToken in candidateTokens:
+            edge = allEdges[entityToken]
             if not edge.isValid:
                 continue
             if edge.isDegenerate:
@@ -115,12 +153,15 @@ class DbFace:
                 
                 #make sure faces adjoining corner edge are planes
                 face1, face2 = edge.faces
-                if face1.geometry.objectType != adsk.core.Plane.classType():
+                if face1.geometry.objectType != _PLANE_CLASS_TYPE:
                     continue
-                if face2.geometry.objectType != adsk.core.Plane.classType():
+                if face2.geometry.objectType != _PLANE_CLASS_TYPE:
                     continue
+                if not isLikelyCornerEdge(face1, face2, cosLow, cosHigh):
+                    continue #normals alone rule out an angle within the limits - skip the full angle calculation
 
-                angle = round(getAngleBetweenFaces(edge) * 180 / pi, 3)
+                cornerAngle = getAngleBetweenFaces(edge, entityToken)  # radians - handed on to DbEdge
+                angle = round(cornerAngle * 180 / pi, 3)
                 if (
                     (abs(angle - 90) > 0.001)
                     and not (self._params.acuteAngle or self._params.obtuseAngle)
@@ -148,10 +189,10 @@ class DbFace:
                     ):
                     continue #angle between min and max and doing both acute and obtuse
 
-                edgeId = hash(edge.entityToken) #this normally created by the DbEdge instantiation, but it's needed earlier (I thmk!)
-                self.selection.selectedEdges[edgeId] = self._associatedEdgesDict[ 
-                    edgeId
-                ] = DbEdge(edge=edge, parentFace=self)
+                dbEdge = DbEdge(edge=edge, parentFace=self, entityToken=entityToken, cornerAngle=cornerAngle)
+                self.selection.selectedEdges[dbEdge.edgeId] = self._associatedEdgesDict[
+                    dbEdge.edgeId
+                ] = dbEdge
                 self.processedEdges.append(edge)
                 self.selection.addingEdges = True
                 if not self._restoreState:
@@ -181,9 +222,7 @@ class DbFace:
         """
         Saves parameters and state to edge attribute 
         """
-        params = self._params.to_dict()
-        params.update({"selected":self._selected})
-        self.face.attributes.add(DB_GROUP, "face:"+str(self._faceId), json.dumps(params))
+        self.face.attributes.add(DB_GROUP, "face:"+str(self._faceId), self._params.to_json(selected=self._selected))
         self.face.attributes.add(DB_GROUP, "token:", self._entityToken)
 
     def restore(self):
@@ -199,7 +238,7 @@ class DbFace:
         value = attr.value
         params = json.loads(value)
         self._selected = params.pop("selected")
-        self._params = DbParams(**params)
+        self._params = DbParams.from_dict(params)
 
     def selectAll(self):
         """
@@ -207,7 +246,8 @@ class DbFace:
         """
         self._selected = True
         self.selection.addingEdges = True
-        [selectedEdge.select() for selectedEdge in self._associatedEdgesDict.values()]
+        for selectedEdge in self._associatedEdgesDict.values():
+            selectedEdge.select()
         self.selection.addingEdges = False
 
     def deselectAll(self):
@@ -216,13 +256,10 @@ class DbFace:
         """
         self._selected = False
         self.selection.addingEdges = True
-        [
-            (
-                selectedEdge.deselect(),
-                self.ui.activeSelections.removeByEntity(selectedEdge.edge),
-            )
-            for selectedEdge in self._associatedEdgesDict.values()
-        ]
+        activeSelections = self.ui.activeSelections
+        for selectedEdge in self._associatedEdgesDict.values():
+            selectedEdge.deselect()
+            activeSelections.removeByEntity(selectedEdge.edge)
         self.selection.addingEdges = False
 
     def reSelectEdges(self):
@@ -253,7 +290,7 @@ class DbFace:
 
     @property
     def edgeIdSet(self):
-        return set(self._associatedEdgesDict.keys())
+        return set(self._associatedEdgesDict)
 
     @property
     def selectedEdges(self):
@@ -270,16 +307,22 @@ class DbFace:
     @property
     def vertices(self):
         '''Returns native vertices'''
-        return [vertex for vertex in self.native.vertices]
+        if self._vertices is None:
+            self._vertices = [vertex for vertex in self.native.vertices]
+        return self._vertices
+
+    @property
+    def edgeIndex(self) -> dict:
+        '''Returns native face edges keyed by tempId'''
+        if self._edgeIndex is None:
+            self._edgeIndex = {edge.tempId: edge for edge in self.native.edges}
+        return self._edgeIndex
 
     def deleteEdges(self):
-        [
-            (
-                self.ui.activeSelections.removeByEntity(edgeObj.edge),
-                self.selection.selectedEdges.pop(edgeId),
-            )
-            for edgeId, edgeObj in self._associatedEdgesDict.items()
-        ]
+        activeSelections = self.ui.activeSelections
+        for edgeId, edgeObj in self._associatedEdgesDict.items():
+            activeSelections.removeByEntity(edgeObj.edge)
+            self.selection.selectedEdges.pop(edgeId)
         try:
             del self._associatedEdgesDict
         except AttributeError:
@@ -289,6 +332,18 @@ class DbFace:
     def faceId(self):
         return self._faceId
 
+    def translationTo(self, topFace: adsk.fusion.BRepFace) -> tuple:
+        """
+        Returns the (x, y, z) translation from this face to topFace - every edge of the face needs the same
+        translation, so it's kept for the topFace object last asked for
+        """
+        if self._topFaceTranslation is None or self._topFaceTranslation[0] is not topFace:
+            translation = getTranslateVectorBetweenFaces(self.native, topFace)
+            if translation is False:
+                raise DogboneTopologyError(f"top face is not parallel to face {self._faceId} - can't place its dogbones")
+            self._topFaceTranslation = (topFace, tuple(translation.asArray()))
+        return self._topFaceTranslation[1]
+
     @property
     def component(self) -> adsk.fusion.Component:
         """
@@ -308,32 +363,41 @@ class DbFace:
 
     @property
     def occurrenceId(self) -> int:
-        return (
-            hash(self.face.assemblyContext.entityToken)
-            if self.face.assemblyContext
-            else hash(self.face.body.entityToken)
-        )
+        return self._occurrenceId
 
     def removeFaceFromSelectedOccurrences(self):
-        faceList = self.selection.selectedOccurrences[self.occurrenceId]
+        occurrenceId = self.occurrenceId
+        faceList = self.selection.selectedOccurrences[occurrenceId]
         faceList.remove(self)
+        if not faceList:
+            # drop the emptied entry - consumers expect every listed occurrence to have at least one face
+            del self.selection.selectedOccurrences[occurrenceId]
+        self.selection.facesChanged()
 
     @property
     def native(self):
         return self._native
 
     def revalidate(self) -> adsk.fusion.BRepFace:
-        return cast(adsk.fusion.BRepFace, self.component.findBRepUsingPoint(
+        face: adsk.fusion.BRepFace = self.component.findBRepUsingPoint(
             self._refPoint, adsk.fusion.BRepEntityTypes.BRepFaceEntityType, -1.0, False
-        ).item(0))
+        ).item(0)
+        return face
 
 
 class DbEdge:
     logger = logging.getLogger("dogbone.DbEdge")
 
-    def __init__(self, edge: adsk.fusion.BRepEdge, parentFace: DbFace):
+    def __init__(
+            self,
+            edge: adsk.fusion.BRepEdge,
+            parentFace: DbFace,
+            entityToken: str = None,
+            cornerAngle: float = None
+    ):
 
 
+        self._parentFace = parentFace  # needed by the component property when the edge has to be found again
         self._refPoint = edge.pointOnEdge
 
         self.edge = (
@@ -347,55 +411,62 @@ class DbEdge:
             ).item(0)
         )
 
-        self.entityToken = edge.entityToken
+        self.entityToken = entityToken if entityToken else edge.entityToken
         self._edgeId = hash(self.entityToken)
         self._selected = True
-        self._parentFace = parentFace
-        self._native = self.edge.nativeObject if self.edge.nativeObject else self.edge
+        nativeObject = self.edge.nativeObject
+        self._native = nativeObject if nativeObject else self.edge
         self._component = edge.body.parentComponent
         self._params = self._parentFace._params
-        self._cornerAngle = getAngleBetweenFaces(edge)
+        self._cornerAngle = cornerAngle if cornerAngle is not None else getAngleBetweenFaces(edge, self.entityToken)
 
 # Everything from now on should be in the nativeObject context
 
-        edge0, edge1 = getCornerEdgesAtFace(face=self._parentFace.native, edge=self._native)
-
-        shortEdge, longEdge = (edge0, edge1) if edge0.length < edge1.length else (edge1, edge0)  
-
-        face0, face1 = (face for face in self.native.faces) #get the 2 adjacent faces of the dogbone edge
-
-        self.shortFace, self.longFace = (face0, face1) if shortEdge in face0.edges else (face1, face0)
+        self.shortFace, self.longFace = getSideFaces(
+            face=self._parentFace.native, edge=self._native, faceEdges=self._parentFace.edgeIndex
+        )
 
         _, self.shortFaceNormal = self.shortFace.evaluator.getNormalAtPoint(self.shortFace.pointOnFace)#get their normal vectors
         _, self.longFaceNormal = self.longFace.evaluator.getNormalAtPoint(self.longFace.pointOnFace)
 
-        self._customGraphicGroup = None
+        # face normal components - getToolBody builds the dogbone offset from these in python
+        self._shortNormalCoords = tuple(self.shortFaceNormal.asArray())
+        self._longNormalCoords = tuple(self.longFaceNormal.asArray())
+        # sum of the 2 face normals - bisects the corner angle
+        self._bisectorCoords = tuple(s + l for s, l in zip(self._shortNormalCoords, self._longNormalCoords))
+        # read only: getToolBody copies it where it scales
+        self._bisector = adsk.core.Vector3D.create(*self._bisectorCoords)
+        self._cornerVector = self._bisector.copy()
+        self._cornerVector.normalize()
 
-        self._dogboneCentre = (
-            self.native.startVertex.geometry
-            if self.native.startVertex in self._parentFace.native.vertices
-            else self.native.endVertex.geometry
-        )
+        self._customGraphicGroup = None
 
+        # which end of the edge touches the parent face is only worked out once
+        startVertex, endVertex = self.native.startVertex, self.native.endVertex
+        startGeometry, endGeometry = startVertex.geometry, endVertex.geometry
         self._nativeEndPoints = (
-            (self.native.startVertex.geometry, self.native.endVertex.geometry)
-            if self.native.startVertex in self._parentFace.native.vertices
-            else (self.native.endVertex.geometry, self.native.startVertex.geometry)
+            (startGeometry, endGeometry)
+            if startVertex in self._parentFace.vertices
+            else (endGeometry, startGeometry)
         )
 
+        self._dogboneCentre = self._nativeEndPoints[0]
+
         startPoint, endPoint = self._nativeEndPoints
 
         self._nativeEdgeVector: adsk.core.Vector3D = startPoint.vectorTo(endPoint)
         self._nativeEdgeVector.normalize()
 
-        sx,sy,sz = self._nativeEndPoints[0].asArray()
-        ex,ey,ez = self._nativeEndPoints[1].asArray()
+        # plain coordinates - getToolBody positions the tool from these without further API calls
+        self._nativeEndCoords = (tuple(startPoint.asArray()), tuple(endPoint.asArray()))
+        (sx, sy, sz), (ex, ey, ez) = self._nativeEndCoords
 
-        DbEdge.logger.debug(f'\nedge: {self._edgeId}'
-                    f'\n native: {self.native != None}'
-                    f'\n startPoint: ({sx:.2f},{sy:.2f},{sz:.2f}),({ex:.2f},{ey:.2f},{ez:.2f})'
-                    f'\n edgeLength: {startPoint.distanceTo(endPoint):.2f}'
-                    f'\n parentFace: {self._parentFace._faceId}')
+        if DbEdge.logger.isEnabledFor(logging.DEBUG):
+            DbEdge.logger.debug(f'\nedge: {self._edgeId}'
+                        f'\n native: {self.native != None}'
+                        f'\n startPoint: ({sx:.2f},{sy:.2f},{sz:.2f}),({ex:.2f},{ey:.2f},{ez:.2f})'
+                        f'\n edgeLength: {startPoint.distanceTo(endPoint):.2f}'
+                        f'\n parentFace: {self._parentFace._faceId}')
         
         if self._parentFace._restoreState:
             self.restore()
@@ -403,6 +474,10 @@ class DbEdge:
     def __hash__(self):
         return self._edgeId
 
+    @property
+    def edgeId(self):
+        return self._edgeId
+
     def select(self):
         self._selected = True
 
@@ -410,9 +485,7 @@ class DbEdge:
         """
         Saves parameters and state to edge attribute 
         """
-        params = self._params.to_dict()
-        params.update({"selected":self._selected})
-        self.edge.attributes.add(DB_GROUP, "params:", json.dumps(params))
+        self.edge.attributes.add(DB_GROUP, "params:", self._params.to_json(selected=self._selected))
 
     def restore(self):
         """
@@ -426,7 +499,7 @@ class DbEdge:
         value = attr.value
         params = json.loads(value)
         self._selected = params.pop("selected")
-        self._params = DbParams(**params)
+        self._params = DbParams.from_dict(params)
         
     @property
     def component(self) -> adsk.fusion.Component:
@@ -467,7 +540,7 @@ class DbEdge:
         """
         returns the two parent face edges associated with dogbone edge 
         """
-        return getCornerEdgesAtFace(face=self._parentFace.native, edge=self.native)
+        return getCornerEdgesAtFace(face=self._parentFace.native, edge=self.native, faceEdges=self._parentFace.edgeIndex)
 
     @property
     def cornerVector(self) -> adsk.core.Vector3D:
@@ -510,8 +583,6 @@ class DbEdge:
         box = None
 
         tempBrepMgr = adsk.fusion.TemporaryBRepManager.get()
-        startPoint, endPoint = self.nativeEndPoints
-        startPoint, endPoint = startPoint.copy(), endPoint.copy()
 
         params = self._params
         
@@ -532,33 +603,33 @@ class DbEdge:
             else 1
         )
 
-        if topFace:
-            translateVector = getTranslateVectorBetweenFaces(
-                self._parentFace.native, topFace
-                )
-            startPoint.translateBy(translateVector)
+        tx, ty, tz = self._parentFace.translationTo(topFace) if topFace else (0.0, 0.0, 0.0)
 
         if params.dbType == MORTISE_DOGBONE:
-            dirVect = self.shortFaceNormal.copy() if params.longSide else self.longFaceNormal.copy()
+            nx, ny, nz = self._shortNormalCoords if params.longSide else self._longNormalCoords
         else:
-            dirVect = self.shortFaceNormal.copy()
-            dirVect.add(self.longFaceNormal) #adding the 2 face normal vectors results in a vector that bisects the corner angle
-
-        dirVect.normalize()
-        dirVect.scaleBy(centreDistance)
-        startPoint.translateBy(dirVect)
-        endPoint.translateBy(dirVect)
-        s, e = self.nativeEndPoints
-        DbEdge.logger.debug(f'\nGet Tool Body:++++++++++++++++'
-            f'\n mode: {params.dbType}'
-            f'\n native: {self.native.assemblyContext == None}'
-            f'\n edge: {self._edgeId}'
-            f'\n startPoint: {s.asArray()}'
-            f'\n calculatedStartPoint: {startPoint.asArray()}'
-            # f'\n direction0: {direction0.asArray()}'
-            # f'\n direction1: {direction1.asArray()}'
-            f'\n dirVect(normalized): {dirVect.asArray()}'
-            f'\n edgeLength: {startPoint.distanceTo(endPoint): .2f}')
+            nx, ny, nz = self._bisectorCoords #adding the 2 face normal vectors results in a vector that bisects the corner angle
+
+        # offset direction normalised and scaled to centreDistance in one step
+        scale = centreDistance / sqrt(nx * nx + ny * ny + nz * nz)
+        dx, dy, dz = nx * scale, ny * scale, nz * scale
+
+        # start and end are offset in python and each created once, rather than copied and translated in place
+        (sx, sy, sz), (ex, ey, ez) = self._nativeEndCoords
+        startPoint = adsk.core.Point3D.create(sx + tx + dx, sy + ty + dy, sz + tz + dz)
+        endPoint = adsk.core.Point3D.create(ex + dx, ey + dy, ez + dz)
+        if DbEdge.logger.isEnabledFor(logging.DEBUG):
+            s, e = self.nativeEndPoints
+            DbEdge.logger.debug(f'\nGet Tool Body:++++++++++++++++'
+                f'\n mode: {params.dbType}'
+                f'\n native: {self.native.assemblyContext == None}'
+                f'\n edge: {self._edgeId}'
+                f'\n startPoint: {s.asArray()}'
+                f'\n calculatedStartPoint: {startPoint.asArray()}'
+                # f'\n direction0: {direction0.asArray()}'
+                # f'\n direction1: {direction1.asArray()}'
+                f'\n dirVect(normalized): {(dx, dy, dz)}'
+                f'\n edgeLength: {startPoint.distanceTo(endPoint): .2f}')
 
         toolbody = tempBrepMgr.createCylinderOrCone(
             endPoint, effectiveRadius, startPoint, effectiveRadius
@@ -581,8 +652,7 @@ class DbEdge:
         boxLength = effectiveRadius / cornerTan - centreDistance
         boxWidth = effectiveRadius * 2
 
-        lengthDirectionVector = self.shortFaceNormal.copy()
-        lengthDirectionVector.add(self.longFaceNormal)
+        lengthDirectionVector = self._bisector.copy()
         lengthDirectionVector.normalize()
         lengthDirectionVector.scaleBy(boxLength / 2)
 
@@ -599,8 +669,7 @@ class DbEdge:
 
         boxCentrePoint.translateBy(heightDirectionVector)
 
-        cornerVector = self.shortFaceNormal.copy()
-        cornerVector.add(self.longFaceNormal)
+        cornerVector = self._bisector  # only read - widthDirectionVector is a copy
 
         #   rotate centreLine Vector (cornerVector) by 90deg to get width direction vector
         orthogonalMatrix = adsk.core.Matrix3D.create()
@@ -638,8 +707,7 @@ class DbEdge:
             self._parentFace._customGraphicGroup = (
                 self._component.customGraphicsGroups.add()
             )
-        coordList = []
-        [coordList.extend([n for n in p.asArray()]) for p in self.endPoints]
+        coordList = [*self._nativeEndCoords[0], *self._nativeEndCoords[1]]
         coords = adsk.fusion.CustomGraphicsCoordinates.create(coordList)
 
         line: adsk.fusion.CustomGraphicsLine = (
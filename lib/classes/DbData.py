@@ -2,12 +2,15 @@
 #Dataclass structure that gets attached to each entity - allows mode and style of dogbone to be retrieved and used in refresh
 import os
 import logging
+import re
 import adsk.core
 import json
+import pickle
 
-from dataclasses import dataclass
-
-from ...py_packages.dataclasses_json import dataclass_json
+from dataclasses import dataclass, field, fields
+from typing import ClassVar
+from functools import lru_cache
+from math import cos, radians
 
 # appPath = os.path.dirname(os.path.abspath(__file__))
 basePath = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,10 +18,80 @@ CONFIG_PATH = os.path.join(basePath, "defaults.dat")
 
 logger = logging.getLogger("dogbone.DbParams")
 
-@dataclass_json
-@dataclass
+# config file buffer - the whole file is read/written in a single call
+_IO_BUFFER = 65536
+# the defaults file is a pickled field dict - protocol 2+ pickles start with the PROTO opcode,
+# anything else is the JSON format of earlier versions
+_PICKLE_PREFIX = b"\x80"
+
+try:
+    import orjson  # optional - not bundled with Fusion, used when it's importable
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+    _loadb = orjson.loads
+except ImportError:
+    # codec singletons - built once rather than on every (de)serialization
+    _dumps = json.JSONEncoder(separators=(",", ":")).encode
+    _loads = json.JSONDecoder().decode
+
+    def _loadb(data: bytes):
+        return _loads(data.decode())
+
+_app = None
+
+# "<number> <unit>" is by far the most common tool diameter expression - it can be converted without
+# calling Fusion's evaluator. A bare number is deliberately not matched: Fusion evaluates it in the
+# design's default length units, which aren't known here.
+_SIMPLE_EXPRESSION = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*(in|mm|cm|m|ft)\s*$")
+# Fusion's internal length unit is cm - (multiplier, divisor) keeps mm conversions exact, eg 3 mm -> 0.3
+_UNIT_TO_CM = {"in": (2.54, 1), "mm": (1, 10), "cm": (1, 1), "m": (100, 1), "ft": (30.48, 1)}
+
+_expr_cache: dict = {}  # expression string -> evaluated value (internal units)
+_evaluator = None  # bound unitsManager.evaluateExpression of the active design - reset with the cache
+
+
+def _application() -> adsk.core.Application:
+    """Application is a process wide singleton - fetched once, on first use rather than at import"""
+    global _app
+    if _app is None:
+        _app = adsk.core.Application.get()
+    return _app
+
+
+@lru_cache(maxsize=None)
+def _cosDegrees(angle: float) -> float:
+    return cos(radians(angle))
+
+
+def _evaluate(expression: str) -> float:
+    global _evaluator
+    value = _expr_cache.get(expression)
+    if value is None:
+        match = _SIMPLE_EXPRESSION.match(expression)
+        if match:
+            multiplier, divisor = _UNIT_TO_CM[match[2]]
+            value = float(match[1]) * multiplier / divisor
+        else:
+            if _evaluator is None:
+                _evaluator = _application().activeProduct.unitsManager.evaluateExpression
+            value = _evaluator(expression)
+        _expr_cache[expression] = value
+    return value
+
+
+def clearExpressionCache():
+    """Forget evaluated expressions - user parameters, default units or the active design may have changed"""
+    global _evaluator
+    _expr_cache.clear()
+    _evaluator = None
+
+@dataclass(slots=True)
 class DbParams:
-    """Dataclass - Holds add-in instance setup values"""
+    """Dataclass - Holds add-in instance setup values
+    slotted - attributes that aren't declared fields can't be set on an instance"""
 
     toolDiaStr: str = "0.25 in"
     dbType: str = "Normal Dogbone"
@@ -49,47 +122,137 @@ class DbParams:
 
     previewEnabled: bool = True
 
+    FIELDS: ClassVar[tuple] = ()  # populated after the class is built - see end of module
+
+    # derived values - evaluated from the matching *Str field and kept until that string is reassigned
+    _toolDia: float = field(default=0.0, init=False, repr=False, compare=False)
+    _toolDiaSrc: str = field(default=None, init=False, repr=False, compare=False)
+    _toolDiaOffset: float = field(default=0.0, init=False, repr=False, compare=False)
+    _toolDiaOffsetSrc: str = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # clamp once here (covers values read back from files and attributes) so edge filtering can rely on
+        # 0 <= minAngleLimit <= maxAngleLimit <= 180 without re-checking
+        self.minAngleLimit = max(0.0, min(180.0, self.minAngleLimit))
+        self.maxAngleLimit = max(self.minAngleLimit, min(180.0, self.maxAngleLimit))
+
+    # to_dict / from_dict are generated once the fields are known - see _buildCodec below
+
+    def to_json(self, **extra) -> str:
+        """extra key/values (eg entity selection state) are serialized alongside the fields"""
+        values = self.to_dict()
+        values.update(extra)
+        return _dumps(values)
+
     @classmethod
-    def read_file(cls,  path: str) -> str:
-        with open(path, "r", encoding="UTF-8") as file:
+    def from_json(cls, data: str) -> "DbParams":
+        return cls.from_dict(_loads(data))
+
+    @classmethod
+    def from_defaults(cls) -> "DbParams":
+        """Returns an instance populated from the defaults file, or the built in defaults if unavailable"""
+        data = cls.read_defaults()
+        if not data:
+            return cls()
+        if data.startswith(_PICKLE_PREFIX):
+            try:
+                return cls.from_dict(pickle.loads(data))
+            except Exception:  # unpickling a damaged file can raise almost anything
+                logger.warning("config file unreadable - using built in defaults")
+                return cls()
+        try:
+            instance = cls.from_dict(_loadb(data))
+        except ValueError:
+            logger.warning("config file unreadable - using built in defaults")
+            return cls()
+        try:
+            instance.write_defaults()  # one time migration of a JSON config file
+        except OSError:
+            logger.warning("config file could not be converted - it will be converted on the next save")
+        return instance
+
+    @classmethod
+    def read_file(cls,  path: str) -> bytes:
+        with open(path, "rb", buffering=_IO_BUFFER) as file:
             return file.read()
 
     @classmethod
     def read_defaults(cls):
         logger.info("config file read")
 
-        if not os.path.isfile(CONFIG_PATH):
-            return False
-
         try:
             return cls.read_file(CONFIG_PATH)
-        except ValueError:
+        except FileNotFoundError:
             return False
 
     def write_defaults(self):
         logger.info("config file write")
-        self.write_file(CONFIG_PATH, self.to_json())
+        self.write_file(CONFIG_PATH, pickle.dumps(self.to_dict(), pickle.HIGHEST_PROTOCOL))
 
-    def write_file(cls, path: str, data: str):
-        with open(path, "w", encoding="UTF-8") as file:
+    @classmethod
+    def write_file(cls, path: str, data: bytes):
+        with open(path, "wb", buffering=_IO_BUFFER) as file:
             file.write(data)
 
-    def __post_init__(self):
-        read_str = DbParams.read_defaults()
-        if read_str:
-            self.__dict__ = json.loads(read_str)
-
     @property
     def design(self):
-        app = adsk.core.Application.get()
-        return app.activeProduct
+        # activeProduct is resolved on each call so a document switch is never stale
+        return _application().activeProduct
+
+    def clearCache(self):
+        """Forget evaluated tool diameters - user parameters or default units may have changed"""
+        clearExpressionCache()
+        self._toolDiaSrc = self._toolDiaOffsetSrc = None
 
     @property
     def toolDia(self):
-        return self.design.unitsManager.evaluateExpression(self.toolDiaStr)
+        if self._toolDiaSrc is not self.toolDiaStr:
+            self._toolDia = _evaluate(self.toolDiaStr)
+            self._toolDiaSrc = self.toolDiaStr
+        return self._toolDia
 
     @property
     def toolDiaOffset(self):
-        return self.design.unitsManager.evaluateExpression(self.toolDiaOffsetStr)
+        if self._toolDiaOffsetSrc is not self.toolDiaOffsetStr:
+            self._toolDiaOffset = _evaluate(self.toolDiaOffsetStr)
+            self._toolDiaOffsetSrc = self.toolDiaOffsetStr
+        return self._toolDiaOffset
+
+    @property
+    def cosMin(self) -> float:
+        """cosine of minAngleLimit - lets edge loops compare against normal dot products without trig"""
+        return _cosDegrees(self.minAngleLimit)
+
+    @property
+    def cosMax(self) -> float:
+        """cosine of maxAngleLimit - lets edge loops compare against normal dot products without trig"""
+        return _cosDegrees(self.maxAngleLimit)
+
+# persisted fields as (name, type, default) - resolved once here rather than introspected by every consumer
+DbParams.FIELDS = tuple((f.name, f.type, f.default) for f in fields(DbParams) if f.init)
+_FIELDS = tuple(name for name, _, _ in DbParams.FIELDS)
+
+
+def _buildCodec():
+    """
+    Generates straight line to_dict/from_dict methods (same approach the dataclasses module uses for __init__)
+    - no per call field iteration, getattr or intermediate dict filtering.
+    from_dict ignores keys that aren't fields (eg from older versions) and defaults any that are missing
+    """
+    defaults = {f"_default{i}": default for i, (_, _, default) in enumerate(DbParams.FIELDS)}
+    src = (
+        "def to_dict(self):\n"
+        "    return {" + ", ".join(f"{name!r}: self.{name}" for name in _FIELDS) + "}\n"
+        "def from_dict(cls, values):\n"
+        "    get = values.get\n"
+        "    return cls(" + ", ".join(f"{name}=get({name!r}, _default{i})" for i, name in enumerate(_FIELDS)) + ")\n"
+    )
+    namespace = {}
+    exec(src, defaults, namespace)
+    DbParams.to_dict = namespace["to_dict"]
+    DbParams.from_dict = classmethod(namespace["from_dict"])
+
+
+_buildCodec()
 
-params = DbParams()
+params = DbParams.from_defaults()
@@ -1,12 +1,11 @@
 """Main create dogbone User Interface Dialog """
 import os
-from typing import cast
 
 import adsk.core
 import adsk.fusion
 import logging
 
-from ..utils import getFaceNormal
+from ..utils import getFaceNormal, clearCaches
 from . import DbParams, Selection, DbFace
 from ..utils.decorators import eventHandler, parseDecorator
 from ..common.log import LEVELS, startLogger, stopLogger
@@ -34,7 +33,6 @@ from ...constants import (
     OBTUSE_ANGLE,
     ON_LONG_SIDE,
     ON_SHORT_SIDE,
-    PARAMETRIC,
     PREVIEW_ENABLE,
     SETTINGS_GROUP,
     STATIC,
@@ -50,6 +48,22 @@ from ...constants import (
 _appPath = os.path.dirname(os.path.abspath(__file__))
 logger = logging.getLogger('dogbone.ui')
 
+# objectType strings don't change - fetched once instead of per selected entity
+_EDGE_CLASS_TYPE = adsk.fusion.BRepEdge.classType()
+_FACE_CLASS_TYPE = adsk.fusion.BRepFace.classType()
+
+# dogbone type -> (minimal percent input visible, mortise type input visible)
+_TYPE_VISIBILITY = {
+    NORMAL_DOGBONE: (False, False),
+    MINIMAL_DOGBONE: (True, False),
+    MORTISE_DOGBONE: (False, True),
+}
+
+def _selectedEntities(selectionInput: adsk.core.SelectionCommandInput) -> list:
+    """Fetches all entities of a selection input in one pass"""
+    return [selectionInput.selection(i).entity for i in range(selectionInput.selectionCount)]
+
+
 # noinspection SqlDialectInspection,SqlNoDataSourceInspection,PyMethodMayBeStatic
 class DogboneUi:
     """
@@ -83,10 +97,14 @@ class DogboneUi:
 
         self.inputs = command.commandInputs
 
+        self.param.clearCache()
+        clearCaches()
+
         if self.param.logging == 0:
             stopLogger()
         else:
             startLogger()
+        logging.getLogger("dogbone").setLevel(self.param.logging)
 
         self.create_ui()
         self.onInputChanged(event=command.inputChanged)
@@ -106,16 +124,34 @@ class DogboneUi:
         self.detection_mode()
         self.settings()
 
-    def parseInputs(self, cmdInputs):
+    def parseInputs(self, cmdInputs, changedInput: adsk.core.CommandInput = None):
         """==============================================================================
         put the selections into variables that can be accessed by the main routine
         ==============================================================================
+        changedInput - when a selection input fired the event the settings can't have changed,
+        so only the selection lists are refreshed
         """
 
         logger.debug("parsing Inputs")
 
-        inputs = {inp.id: inp for inp in cmdInputs}
-
+        settingsChanged = changedInput is None or changedInput.id not in (FACE_SELECT, EDGE_SELECT)
+        if settingsChanged:
+            self.parseSettings({inp.id: inp for inp in cmdInputs})
+        # outside the settings skip - a selection-only session must still log at the stored level
+        logging.getLogger("dogbone").setLevel(self.param.logging)
+        if settingsChanged:
+            self.logParams()
+
+        # assigned rather than appended - parseInputs runs after every input change
+        self.selection.edges = [
+            entity for entity in _selectedEntities(self.edgeSelectInput) if entity.objectType == _EDGE_CLASS_TYPE
+        ]
+        self.selection.faces = [
+            entity for entity in _selectedEntities(self.faceSelectInput) if entity.objectType == _FACE_CLASS_TYPE
+        ]
+
+    def parseSettings(self, inputs: dict):
+        """copies the dialog settings into the shared params instance"""
         self.param.logging = LEVELS[inputs[LOGGING].selectedItem.name]
         self.param.toolDiaStr = inputs[TOOL_DIAMETER].expression
         self.param.toolDiaOffsetStr = inputs[TOOL_DIAMETER_OFFSET].expression
@@ -133,24 +169,10 @@ class DogboneUi:
         self.param.expandSettingsGroup = (inputs[SETTINGS_GROUP]).isExpanded
         self.param.previewEnabled = inputs[PREVIEW_ENABLE].value
 
-        mainlogger = logging.getLogger("dogbone")
-
-        mainlogger.setLevel(self.param.logging)
-
-        self.logParams()
-
-        for i in range(inputs[EDGE_SELECT].selectionCount):
-            entity = inputs[EDGE_SELECT].selection(i).entity
-            if entity.objectType == adsk.fusion.BRepEdge.classType():
-                self.selection.edges.append(entity)
-
-        for i in range(inputs[FACE_SELECT].selectionCount):
-            entity = inputs[FACE_SELECT].selection(i).entity
-            if entity.objectType == adsk.fusion.BRepFace.classType():
-                self.selection.faces.append(entity)
-
     # noinspection DuplicatedCode
     def logParams(self):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return  # skips formatting and evaluating the tool diameters
         logger.debug(f"param.fromTop = {self.param.fromTop}")
         logger.debug(f"param.dbType = {self.param.dbType}")
         logger.debug(f"param.toolDiaStr = {self.param.toolDiaStr}")
@@ -199,15 +221,18 @@ class DogboneUi:
         """
         eventArgs: adsk.core.SelectionEventArgs = args
         # Check which selection input the event is firing for.
-        activeIn = eventArgs.firingEvent.activeInput
-        if activeIn.id != FACE_SELECT and activeIn.id != EDGE_SELECT:
+        activeInId = eventArgs.firingEvent.activeInput.id
+        if activeInId != FACE_SELECT and activeInId != EDGE_SELECT:
             return  # jump out if not dealing with either of the two selection boxes
 
         if self.previewActive and self.param.previewEnabled:
             eventArgs.isSelectable = False
             return
 
-        if activeIn.id == FACE_SELECT:
+        # hovered entity and its occurrence are each read once - this runs on every mouse move
+        entity = eventArgs.selection.entity
+
+        if activeInId == FACE_SELECT:
             # ==============================================================================
             # processing activities when faces are being selected
             #        selection filter is limited to planar faces
@@ -220,80 +245,28 @@ class DogboneUi:
             ):  # get out if the face selection list is empty
                 eventArgs.isSelectable = True
                 return
-            if not eventArgs.selection.entity.assemblyContext:
-                # dealing with a root component body
-
-                activeBodyName = hash(eventArgs.selection.entity.body.entityToken)
-                try:
-                    faces = self.selection.selectedOccurrences[activeBodyName]
-                    for face in faces:
-                        if face.isSelected:
-                            primaryFace = face
-                            break
-                    else:
-                        eventArgs.isSelectable = True
-                        return
-                except (KeyError, IndexError) as e:
-                    return
-
-                primaryFaceNormal = getFaceNormal(primaryFace.face)
-                if primaryFaceNormal.isParallelTo(
-                        getFaceNormal(eventArgs.selection.entity)
-                ):
+            activeOccurrence = entity.assemblyContext
+            if activeOccurrence:
+                # occurrence face - only one component allowed, to save on conflict checking
+                if activeOccurrence.component not in self.selection.selectedComponents:
                     eventArgs.isSelectable = True
                     return
-                eventArgs.isSelectable = False
-                return
-            # End of root component face processing
-
-            # ==============================================================================
-            # Start of occurrence face processing
-            # ==============================================================================
-            activeOccurrence = eventArgs.selection.entity.assemblyContext
-            activeOccurrenceId = hash(activeOccurrence.entityToken)
-            activeComponent = activeOccurrence.component
-
-            # we got here because the face is either not in root or is on the existing selected list
-            # at this point only need to check for duplicate component selection - Only one component allowed, to save on conflict checking
-            try:
-                #the comprehension in the middle of this flattens the list of lists of self.selection.selectedOccrrences.values()
-                selectedComponentList = [
-                    x.face.assemblyContext.component
-                    for x in [item for sublist in self.selection.selectedOccurrences.values() for item in sublist]
-                    if x.face.assemblyContext
-                ]
-            except KeyError:
-                eventArgs.isSelectable = True
-                return
 
-            if activeComponent not in selectedComponentList:
-                eventArgs.isSelectable = True
-                return
-
-            if (
-                    activeOccurrenceId not in self.selection.selectedOccurrences
-            ):  # check if mouse is over a face that is not already selected
-                eventArgs.isSelectable = False
-                return
+                activeOccurrenceId = hash(activeOccurrence.entityToken)  # only needed past the component check
+                if activeOccurrenceId not in self.selection.selectedOccurrences:
+                    # check if mouse is over a face that is not already selected
+                    eventArgs.isSelectable = False
+                    return
+            else:
+                # dealing with a root component body
+                activeOccurrenceId = hash(entity.body.entityToken)
 
-            try:
-                faces = self.selection.selectedOccurrences[activeOccurrenceId]
-                for face in faces:
-                    if face.isSelected:
-                        primaryFace = face
-                        break
-                    else:
-                        eventArgs.isSelectable = True
-                        return
-            except KeyError:
-                return
-            primaryFaceNormal = getFaceNormal(primaryFace.face)
-            if primaryFaceNormal.isParallelTo(
-                    getFaceNormal(eventArgs.selection.entity)
-            ):
+            # both cases - faces must be parallel to the occurrence's (or body's) primary face
+            primaryFace = self.selection.primaryFace(activeOccurrenceId)
+            if primaryFace is None:
                 eventArgs.isSelectable = True
                 return
-            eventArgs.isSelectable = False
+            eventArgs.isSelectable = primaryFace.faceNormal.isParallelTo(getFaceNormal(entity))
             return
             # end selecting faces
 
@@ -304,14 +277,10 @@ class DogboneUi:
             if self.selection.addingEdges:
                 return
 
-            selected = eventArgs.selection
-            currentEdge: adsk.fusion.BRepEdge = selected.entity
+            currentEdge: adsk.fusion.BRepEdge = entity
 
-            edgeId = hash(currentEdge.entityToken)
-            if edgeId in self.selection.selectedEdges.keys():
-                eventArgs.isSelectable = True
-            else:
-                eventArgs.isSelectable = False
+            # only edges registered against a selected face can be picked
+            eventArgs.isSelectable = hash(currentEdge.entityToken) in self.selection.selectedEdges
             return
 
     @eventHandler(handler_cls=adsk.core.ValidateInputsEventHandler)
@@ -331,38 +300,32 @@ class DogboneUi:
     @parseDecorator
     def onInputChanged(self, args: adsk.core.InputChangedEventArgs):
         input: adsk.core.CommandInput = args.input
-        logger.debug(f"input changed- {input.id}")
+        inputId = input.id  # read once - every property access is a call into Fusion
+        logger.debug(f"input changed- {inputId}")
 
-        # TODO: instead of finding the elements again via id, better to take the reference. Then the casting is
-        # not necessary anymore and the code becomes way slimmer
-
-        if input.id == LOGGING:
-            if input.commandInputs.itemById(LOGGING).listItems.item(input.commandInputs.itemById(LOGGING).selectedItem.index).name == 'Notset':
+        if inputId == LOGGING:
+            if LEVELS[input.selectedItem.name] == logging.NOTSET:
                 stopLogger()
             else:
                 startLogger()
 
-        if input.id == DOGBONE_TYPE:
-            input.commandInputs.itemById(MINIMAL_PERCENT).isVisible = (
-                    cast(adsk.core.ButtonRowCommandInput, input.commandInputs.itemById(DOGBONE_TYPE)).selectedItem.name
-                    == MINIMAL_DOGBONE
-            )
-            input.commandInputs.itemById(MORTISE_TYPE).isVisible = (
-                    cast(adsk.core.ButtonRowCommandInput, input.commandInputs.itemById(DOGBONE_TYPE)).selectedItem.name
-                    == MORTISE_DOGBONE
-            )
+        if inputId == DOGBONE_TYPE:
+            (
+                self.minimalPercentInput.isVisible,
+                self.mortiseTypeInput.isVisible,
+            ) = _TYPE_VISIBILITY[input.selectedItem.name]
             return
 
-        if input.id == TOOL_DIAMETER:
+        if inputId == TOOL_DIAMETER:
             self.param.toolDiaStr:adsk.core.ValueCommandInput = input.expression
             return
 
-        if input.id == PREVIEW_ENABLE:
+        if inputId == PREVIEW_ENABLE:
             self.previewActive = self.param.previewEnabled = input.value
             
 
-            edgeSelectInput = input.parentCommand.commandInputs.itemById(EDGE_SELECT)
-            faceSelectInput = input.parentCommand.commandInputs.itemById(FACE_SELECT)
+            edgeSelectInput = self.edgeSelectInput
+            faceSelectInput = self.faceSelectInput
 
             edgeSelectInput.tooltipDescription = EDGE_TOOLTIP_DESCRIPTION
             faceSelectInput.tooltipDescription = FACE_TOOLTIP_DESCRIPTION
@@ -379,51 +342,34 @@ class DogboneUi:
 
             return
 
-        if input.id == MODE_ROW:
-            input.parentCommand.commandInputs.itemById(
-                ANGLE_DETECTION_GROUP
-            ).isVisible = (cast(adsk.core.ButtonRowCommandInput, input).selectedItem.name == STATIC)
-            self.param.parametric:adsk.core.ButtonRowCommandInput = input.selectedItem.name == PARAMETRIC  #
-
-        if input.id == ACUTE_ANGLE:
-            b = cast(adsk.core.BoolValueCommandInput, input)
-            input.commandInputs.itemById(
-                MIN_SLIDER
-            ).isVisible = b.value
+        if inputId == MODE_ROW:
+            self.angleDetectionGroupInput.isVisible = (input.selectedItem.name == STATIC)
+
+        if inputId == ACUTE_ANGLE:
+            b: adsk.core.BoolValueCommandInput = input
+            self.minSliderInput.isVisible = b.value
             self.param.acuteAngle = b.value
 
-        if input.id == MIN_SLIDER:
-            self.param.minAngleLimit: adsk.core.FloatSliderCommandInput = input.commandInputs.itemById(
-                MIN_SLIDER
-            ).valueOne
+        if inputId == MIN_SLIDER:
+            self.param.minAngleLimit = input.valueOne
 
-        if input.id == OBTUSE_ANGLE:
-            b = cast(adsk.core.BoolValueCommandInput, input)
-            input.commandInputs.itemById(
-                MAX_SLIDER
-            ).isVisible = b.value
+        if inputId == OBTUSE_ANGLE:
+            b: adsk.core.BoolValueCommandInput = input
+            self.maxSliderInput.isVisible = b.value
             self.param.obtuseAngle = b.value
 
-        if input.id == MAX_SLIDER:
-            self.param.maxAngleLimit: adsk.core.FloatSliderCommandInput = input.commandInputs.itemById(
-                MAX_SLIDER
-            ).valueOne
+        if inputId == MAX_SLIDER:
+            self.param.maxAngleLimit = input.valueOne
 
         #
-        if (
-                input.id == ACUTE_ANGLE
-                or input.id == OBTUSE_ANGLE
-                or input.id == MIN_SLIDER
-                or input.id == MAX_SLIDER
-                or input.id == MODE_ROW
-        ):  # refresh edges after specific input changes
+        if inputId in (ACUTE_ANGLE, OBTUSE_ANGLE, MIN_SLIDER, MAX_SLIDER, MODE_ROW):  # refresh edges after specific input changes
             previewState = self.previewActive #need to disable preview, otherwise the wrong entities are displayed/Selected 
             self.previewActive = False
             self.command.doExecutePreview()
-            edgeSelectCommand = input.parentCommand.commandInputs.itemById(EDGE_SELECT)
+            edgeSelectCommand = self.edgeSelectInput
             if not edgeSelectCommand.isVisible:
                 return
-            focusState:adsk.core.SelectionCommandInput = input.parentCommand.commandInputs.itemById(FACE_SELECT).hasFocus
+            focusState = self.faceSelectInput.hasFocus
             edgeSelectCommand.hasFocus = True
 
             for edgeObj in self.selection.selectedEdges.values():
@@ -432,19 +378,18 @@ class DogboneUi:
             for faceObj in self.selection.selectedFaces.values():
                 faceObj.reSelectEdges()
 
-            input.parentCommand.commandInputs.itemById(FACE_SELECT).hasFocus = focusState
+            self.faceSelectInput.hasFocus = focusState
             
             self.previewActive = previewState
             self.command.doExecutePreview()
 
             return
 
-        if input.id != FACE_SELECT and input.id != EDGE_SELECT:
+        if inputId != FACE_SELECT and inputId != EDGE_SELECT:
             return
 
-        logger.debug(f"input changed- {input.id}")
-        s = cast(adsk.core.SelectionCommandInput, input)
-        if input.id == FACE_SELECT:
+        s: adsk.core.SelectionCommandInput = input
+        if inputId == FACE_SELECT:
             # ==============================================================================
             #            processing changes to face selections
             # ==============================================================================
@@ -454,23 +399,21 @@ class DogboneUi:
 
                 # If all faces are removed, just reset registers
                 if s.selectionCount == 0:
-                    self.selection.selectedEdges = {}
-                    self.selection.selectedFaces = {}
-                    self.selection.selectedOccurrences = {}
-
-                    cast(adsk.core.SelectionCommandInput, input.commandInputs.itemById(EDGE_SELECT)).clearSelection()
-                    input.commandInputs.itemById(FACE_SELECT).hasFocus = True
-                    input.commandInputs.itemById(EDGE_SELECT).isVisible = False
+                    self.selection.selectedEdges.clear()
+                    self.selection.selectedFaces.clear()
+                    self.selection.selectedOccurrences.clear()
+                    self.selection.facesChanged()
+
+                    self.edgeSelectInput.clearSelection()
+                    self.faceSelectInput.hasFocus = True
+                    self.edgeSelectInput.isVisible = False
                     return
 
                 # Else find the missing face in selection
-                selectionSet = {
-                    hash(cast(adsk.fusion.BRepEdge, s.selection(i).entity).entityToken)
-                    for i in range(s.selectionCount)
-                }
-                missingFaces = set(self.selection.selectedFaces.keys()) ^ selectionSet
-                input.commandInputs.itemById(EDGE_SELECT).isVisible = True
-                input.commandInputs.itemById(EDGE_SELECT).hasFocus = True
+                selectionSet = {calcId(entity) for entity in _selectedEntities(s)}
+                missingFaces = self.selection.selectedFaces.keys() - selectionSet
+                self.edgeSelectInput.isVisible = True
+                self.edgeSelectInput.hasFocus = True
 
                 for missingFace in missingFaces:
                     faceObj = self.selection.selectedFaces[missingFace]
@@ -478,60 +421,42 @@ class DogboneUi:
                     faceObj.deleteEdges()
                     self.selection.selectedFaces.pop(missingFace)
 
-                input.commandInputs.itemById(FACE_SELECT).hasFocus = True
+                self.faceSelectInput.hasFocus = True
 
                 return
 
             # ==============================================================================
             #             Face has been added - assume that the last selection entity is the one added
             # ==============================================================================
-            input.commandInputs.itemById(EDGE_SELECT).isVisible = True
-            input.commandInputs.itemById(EDGE_SELECT).hasFocus = True
+            self.edgeSelectInput.isVisible = True
+            self.edgeSelectInput.hasFocus = True
 
-            selectionDict = {
-                hash(
-                    cast(adsk.fusion.BRepEdge, s.selection(i).entity).entityToken
-                ): s.selection(i).entity
-                for i in range(s.selectionCount)
-            }
+            selectionDict = None
+            if s.selectionCount == len(self.selection.selectedFaces) + 1:
+                # usual case - a single click appends the new face to the end of the selection list
+                entity = s.selection(s.selectionCount - 1).entity
+                if (faceId := calcId(entity)) not in self.selection.selectedFaces:
+                    selectionDict = {faceId: entity}
 
-            addedFaces = set(self.selection.selectedFaces.keys()) ^ set(
-                selectionDict.keys()
-            )  # get difference -> results in
+            if selectionDict is None:
+                selectionDict = {calcId(entity): entity for entity in _selectedEntities(s)}
 
-            for faceId in addedFaces:
-                changedEntity = selectionDict[
-                    faceId
-                ] 
-                activeOccurrenceId = (
-                    hash(changedEntity.assemblyContext.entityToken)
-                    if changedEntity.assemblyContext
-                    else hash(changedEntity.body.entityToken)
-                )
+            addedFaces = selectionDict.keys() - self.selection.selectedFaces.keys()  # faces not registered yet
 
-                faces = self.selection.selectedOccurrences.get(activeOccurrenceId, [])
-
-                faces += (
-                    createdFace := [
-                        DbFace(
-                            face=changedEntity,
-                            selection=self.selection,
-                            params=self.param,
-                            commandInputsEdgeSelect=input.commandInputs.itemById(
-                                EDGE_SELECT
-                            ),
-                        )
-                    ]
+            for faceId in addedFaces:
+                faceObj = DbFace(
+                    face=selectionDict[faceId],
+                    selection=self.selection,
+                    params=self.param,
+                    commandInputsEdgeSelect=self.edgeSelectInput,
                 )
-                self.selection.selectedOccurrences[
-                    activeOccurrenceId
-                ] = faces  # adds a face to a list of faces associated with this occurrence
-                self.selection.selectedFaces.update({faceObj.faceId: faceObj for faceObj in createdFace})
+                # adds a face to the list of faces associated with this occurrence
+                self.selection.selectedOccurrences[faceObj.occurrenceId].append(faceObj)
+                self.selection.selectedFaces[faceObj.faceId] = faceObj
+                faceObj.selectAll()
+            self.selection.facesChanged()
 
-                for face_id in addedFaces:
-                    self.selection.selectedFaces[face_id].selectAll()
-
-                input.commandInputs.itemById(FACE_SELECT).hasFocus = True
+            self.faceSelectInput.hasFocus = True
 
             return
             # end of processing faces
@@ -544,14 +469,8 @@ class DogboneUi:
             #             an edge has been removed
             # ==============================================================================
 
-            changedSelectionList = [
-                s.selection(i).entity
-                for i in range(s.selectionCount)
-            ]
-            changedEdgeIdSet = set(
-                map(calcId, changedSelectionList)
-            )  # converts list of edges to a list of their edgeIds
-            missingEdges = set(self.selection.selectedEdges.keys()) - changedEdgeIdSet
+            changedEdgeIdSet = {calcId(entity) for entity in _selectedEntities(s)}  # edgeIds of the edges still selected
+            missingEdges = self.selection.selectedEdges.keys() - changedEdgeIdSet
             # noinspection PyStatementEffect
 
             for missingEdge in missingEdges:
@@ -566,10 +485,7 @@ class DogboneUi:
             #         Start of adding a selected edge
             #         Edge has been added - assume that the last selection entity is the one added
             # ==============================================================================
-            selection_command_input = cast(adsk.core.SelectionCommandInput, input)
-            edge: adsk.fusion.BRepEdge = cast(adsk.fusion.BRepEdge, selection_command_input.selection(
-                selection_command_input.selectionCount - 1
-            ).entity)
+            edge: adsk.fusion.BRepEdge = s.selection(s.selectionCount - 1).entity
             # noinspection PyStatementEffect
             self.selection.selectedEdges[
                 calcId(edge)
@@ -580,6 +496,7 @@ class DogboneUi:
             self.inputs.addGroupCommandInput(ANGLE_DETECTION_GROUP, "Detection Mode")
         )
         angleDetectionGroupInputs.isExpanded = self.param.angleDetectionGroup
+        self.angleDetectionGroupInput = angleDetectionGroupInputs
         enableAcuteAngleInput: adsk.core.BoolValueCommandInput = (
             angleDetectionGroupInputs.children.addBoolValueInput(
                 ACUTE_ANGLE, "Acute Angle", True, "", self.param.acuteAngle
@@ -595,6 +512,7 @@ class DogboneUi:
         )
         minAngleSliderInput.isVisible = self.param.acuteAngle
         minAngleSliderInput.valueOne = self.param.minAngleLimit
+        self.minSliderInput = minAngleSliderInput
         enableObtuseAngleInput: adsk.core.BoolValueCommandInput = (
             angleDetectionGroupInputs.children.addBoolValueInput(
                 OBTUSE_ANGLE, "Obtuse Angle", True, "", self.param.obtuseAngle
@@ -610,6 +528,7 @@ class DogboneUi:
         )
         maxAngleSliderInput.isVisible = self.param.obtuseAngle
         maxAngleSliderInput.valueOne = self.param.maxAngleLimit
+        self.maxSliderInput = maxAngleSliderInput
 
     def mode(self):
         modeGroup: adsk.core.GroupCommandInput = self.inputs.addGroupCommandInput(
@@ -654,7 +573,12 @@ class DogboneUi:
             "Along Longest will have the dogbones cut into the longer sides."
             "\nAlong Shortest will have the dogbones cut into the shorter sides."
         )
-        mortiseRowInput.isVisible = self.param.dbType == MORTISE_DOGBONE
+        # a dbType saved by an older version has no entry - show it like a normal dogbone
+        minimalVisible, mortiseVisible = _TYPE_VISIBILITY.get(
+            self.param.dbType, _TYPE_VISIBILITY[NORMAL_DOGBONE]
+        )
+        mortiseRowInput.isVisible = mortiseVisible
+        self.mortiseTypeInput = mortiseRowInput
         minPercentInp = modeGroupChildInputs.addValueInput(
             MINIMAL_PERCENT,
             "Percentage Reduction",
@@ -663,7 +587,8 @@ class DogboneUi:
         )
         minPercentInp.tooltip = "Percentage of tool radius added to push out dogBone - leaves actual corner exposed"
         minPercentInp.tooltipDescription = "This should typically be left at 10%, but if the fit is too tight, it should be reduced"
-        minPercentInp.isVisible = self.param.dbType == MINIMAL_DOGBONE
+        minPercentInp.isVisible = minimalVisible
+        self.minimalPercentInput = minPercentInp
         depthRowInput: adsk.core.ButtonRowCommandInput = (
             modeGroupChildInputs.addButtonRowCommandInput(
                 DEPTH_EXTENT, "Depth Extent", False
@@ -720,9 +645,8 @@ class DogboneUi:
             f"Location: {os.path.join(_appPath, 'dogBone.log')}"
         )
 
-        log.listItems.add("Notset", self.param.logging == 0)
-        log.listItems.add("Debug", self.param.logging == 10)
-        log.listItems.add("Info", self.param.logging == 20)
+        for levelName in ("Notset", "Debug", "Info"):
+            log.listItems.add(levelName, self.param.logging == LEVELS[levelName])
 
     def offset(self):
 
@@ -767,6 +691,7 @@ class DogboneUi:
         ui.addSelectionFilter("LinearEdges")
         ui.setSelectionLimits(1, 0)
         ui.isVisible = False
+        self.edgeSelectInput = ui
 
     def face_select(self):
 
@@ -786,3 +711,4 @@ class DogboneUi:
         ui.tooltipDescription = tooltipDesc
         ui.addSelectionFilter("PlanarFaces")
         ui.setSelectionLimits(1, 0)
+        self.faceSelectInput = ui
@@ -1,4 +1,4 @@
 from .DbClasses import *
 from .DbContext import *
 from .DbData import *
-from .DogboneUi import *
\ No newline at end of file
+# DogboneUi is not re-exported - it's imported when a command is created, see commands/createCommand/entry.py
@@ -6,4 +6,8 @@ class FaceInvalidError(Exception):
 
 class EdgeInvalidError(Exception):
     def __init__(self) -> None:
-        super().__init__("Edge is no longer available")
\ No newline at end of file
+        super().__init__("Edge is no longer available")
+
+class DogboneTopologyError(ValueError):
+    def __init__(self, message: str = "Unexpected topology at dogbone corner") -> None:
+        super().__init__(message)
@@ -10,8 +10,15 @@ LEVELS = {
     "Error": 40,
 }
 
+_logHandler = None  # the single file handler - kept attached between command runs
+
+
 def startLogger():
+    """Attaches the log file handler - repeat calls while it's attached are no-ops"""
+    global _logHandler
     logger = logging.getLogger("dogbone")
+    if _logHandler is not None and _logHandler in logger.handlers:
+        return logger
     formatter = logging.Formatter(
         "%(asctime)s ; %(name)s ; %(levelname)s ; %(lineno)d; %(message)s"
     )
@@ -21,11 +28,14 @@ def startLogger():
     logHandler.setFormatter(formatter)
     logHandler.flush()
     logger.addHandler(logHandler)
+    _logHandler = logHandler
     return logger
 
 def stopLogger():
+    global _logHandler
     logger = logging.getLogger("dogbone")
-    for handler in logger.handlers:
+    _logHandler = None
+    for handler in list(logger.handlers):  # copy - removing while iterating skips handlers
         handler.flush()
         handler.close()
         logger.removeHandler(handler)
\ No newline at end of file
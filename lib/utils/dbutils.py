@@ -4,10 +4,23 @@ import math
 import adsk.core
 import adsk.fusion
 
+from ..common.errors import DogboneTopologyError
+
 logger = logging.getLogger("dogbone.dbutils")
 
+_PLANE_CLASS_TYPE = adsk.core.Plane.classType()  # constant - avoids an API call per face checked
+_angleCache = {}  # edge entityToken: corner angle in radians
+_normalCache = {}  # face entityToken: face normal (Vector3D - shared, treat as read only)
+
+
+def clearCaches():
+    """Forget cached edge and face geometry - call at the start of each command, the model may have changed since the last one"""
+    _angleCache.clear()
+    _normalCache.clear()
+
+
 def debugFace(face):
-    if logger.level < logging.DEBUG:
+    if not logger.isEnabledFor(logging.DEBUG):
         return
     for edge in face.edges:
         logger.debug(
@@ -15,11 +28,33 @@ def debugFace(face):
         )
 
 
-def getAngleBetweenFaces(edge: adsk.fusion.BRepEdge) -> float:
+def getAngleBetweenFaces(edge: adsk.fusion.BRepEdge, entityToken: str = None) -> float:
     """
     returns radian angle between faces
+    results are cached by edge entityToken - pass the token if it has already been read
+    """
+    if entityToken is None:
+        entityToken = edge.entityToken
+    if (angle := _angleCache.get(entityToken)) is not None:
+        return angle
+    angle = _angleCache[entityToken] = _getAngleBetweenFaces(edge)
+    return angle
+
+
+def isLikelyCornerEdge(face1: adsk.fusion.BRepFace, face2: adsk.fusion.BRepFace, cosLow: float, cosHigh: float) -> bool:
     """
+    cheap prefilter for getAngleBetweenFaces - uses only the 2 face normals, no coEdge or vertex lookups
+    an inside corner's angle is pi less the angle between the face normals, so its cosine is -(normal1 . normal2)
+    returns False when that cosine can't fall between cosHigh and cosLow (cosines of the highest and lowest wanted angle)
+    """
+    ax, ay, az = getFaceNormal(face1).asArray()
+    bx, by, bz = getFaceNormal(face2).asArray()
+    cosAngle = -(ax * bx + ay * by + az * bz)
+    # small margin - the exact (rounded) angle test is left to the caller, this only discards clear misses
+    return cosHigh - 1e-4 <= cosAngle <= cosLow + 1e-4
+
 
+def _getAngleBetweenFaces(edge: adsk.fusion.BRepEdge) -> float:
     """
     Steps:
     get both adjacent faces of the edge
@@ -35,37 +70,46 @@ def getAngleBetweenFaces(edge: adsk.fusion.BRepEdge) -> float:
     ie opposite to face1 coEdge direction
     """
     # Verify that the two faces are planar.
-    face1, face2 = (face for face in edge.faces)
-    if not face1 or not face2:
+    faces = list(edge.faces)
+    if len(faces) != 2:
         return 0
+    face1, face2 = faces
     if (
-        face1.geometry.objectType != adsk.core.Plane.classType()
-        or face2.geometry.objectType != adsk.core.Plane.classType()
+        face1.geometry.objectType != _PLANE_CLASS_TYPE
+        or face2.geometry.objectType != _PLANE_CLASS_TYPE
     ):
         return 0
 
-    # Get the normal of each face.
-    _, normal1 = face1.evaluator.getNormalAtPoint(face1.pointOnFace)
-    _, normal2 = face2.evaluator.getNormalAtPoint(face2.pointOnFace)
-    # Get the angle between the normals.
-    normalAngle = normal1.angleTo(normal2)
+    # Get the normal of each face - as plain coordinates, the rest of the maths is done in python.
+    # getFaceNormal is cached - shares the normals with isLikelyCornerEdge and with neighbouring corners on the same face
+    ax, ay, az = getFaceNormal(face1).asArray()
+    bx, by, bz = getFaceNormal(face2).asArray()
+    # Get the angle between the (unit) normals - clamped, rounding can push the dot product just past +/-1
+    dot = ax * bx + ay * by + az * bz
+    normalAngle = math.acos(max(-1.0, min(1.0, dot)))
+    if abs(dot) > 1 - 1e-9:
+        # flat (or knife edge) - the cross product vanishes, so there's no orientation to resolve
+        return math.pi - normalAngle
 
     # Get the co-edge of the selected edge for face1.
-    coEdge1, coEdge2 = (coEdge for coEdge in edge.coEdges)
+    # == rather than "is" - Fusion hands back a new proxy object on every access, so identity never matches
+    coEdge1, coEdge2 = list(edge.coEdges)
     coEdge = coEdge1 if coEdge1.loop.face == face1 else coEdge2
 
     # Create a vector that represents the direction of the co-edge.
-    edgeVec = getEdgeVector(edge, reverse=coEdge.isOpposedToEdge)
+    (sx, sy, sz), (ex, ey, ez) = _edgePoints(edge)
+    ux, uy, uz = (sx - ex, sy - ey, sz - ez) if coEdge.isOpposedToEdge else (ex - sx, ey - sy, ez - sz)
 
     # Get the cross product of the face normals.
     # normal1 and normal2 are flipped as edge vector is pointing "up"
-    cross = normal2.crossProduct(normal1)
+    cx, cy, cz = by * az - bz * ay, bz * ax - bx * az, bx * ay - by * ax
 
     # Check to see if the cross product is in the same or opposite direction
     # of the co-edge direction.  If it's opposed then it's a convex angle.
+    # (a negative dot product is the same test as an angle greater than pi/2)
     angle = (
         (math.pi * 2) - (math.pi - normalAngle)
-        if edgeVec.angleTo(cross) > math.pi / 2
+        if ux * cx + uy * cy + uz * cz < 0
         else math.pi - normalAngle
     )
 
@@ -96,23 +140,57 @@ def correctedEdgeVector(
 #     return False
 
 
-def getCornerEdgesAtFace(face: adsk.fusion.BRepFace, edge: adsk.fusion.BRepEdge):
+def getCornerEdgesAtFace(face: adsk.fusion.BRepFace, edge: adsk.fusion.BRepEdge, faceEdges: dict = None):
     """
     Gets the 2 edges from the associated face that isn't the dogbone edge 
+    faceEdges - optional {tempId: edge} index of the face's edges, saves rebuilding it for every corner of the same face
     """
     # start and end vertices are in no particular orientation - so find which vertex is corresponds to a vertex in the face
     startVertex = (
         edge.startVertex if edge.startVertex in face.vertices else edge.endVertex
     )
 
-    vertexEdges = {hash(edge.entityToken): edge for edge in startVertex.edges} #get a set of edges associated with the vertex
-    faceEdges = {hash(edge.entityToken): edge for edge in face.edges} #get a set of edges associated with the face
-    commonEdges = set(vertexEdges.keys()) & set(faceEdges.keys())  # intersect both sets - returns the 2 edges that are common to both vertex and face
+    # keyed by tempId - a plain int, unique within the body and far cheaper to fetch than entityToken
+    vertexEdges = {edge.tempId: edge for edge in startVertex.edges} #get a set of edges associated with the vertex
+    if len(vertexEdges) < 3:
+        # the dogbone edge plus 2 face edges - anything less can't be a corner, no need to fetch the face edges
+        raise DogboneTopologyError(f"corner vertex has {len(vertexEdges)} edges, expected at least 3")
+    if faceEdges is None:
+        faceEdges = {edge.tempId: edge for edge in face.edges} #get a set of edges associated with the face
+    commonEdges = vertexEdges.keys() & faceEdges.keys()  # intersect both sets - returns the 2 edges that are common to both vertex and face
     if len(commonEdges) != 2:
-        raise NameError("returnVal len != 2")
-    return (faceEdges[token] for token in commonEdges)
+        raise DogboneTopologyError(f"found {len(commonEdges)} face edges at the corner, expected 2")
+    return tuple(faceEdges[token] for token in commonEdges)
+
+
+
+def getSideFaces(face: adsk.fusion.BRepFace, edge: adsk.fusion.BRepEdge, faceEdges: dict = None):
+    """
+    Returns the 2 faces adjacent to the dogbone edge as (shortFace, longFace) -
+    the short face is the one bounded by the shorter of the 2 face edges at the corner
+    """
+    edge0, edge1 = getCornerEdgesAtFace(face=face, edge=edge, faceEdges=faceEdges)
+    shortEdge = edge0 if edge0.length < edge1.length else edge1
+    face0, face1 = (sideFace for sideFace in edge.faces)
+    # a corner edge only has 2 faces (the parent face and one side face) - much shorter to scan than face0.edges
+    return (face0, face1) if face0 in shortEdge.faces else (face1, face0)
+
+
+def unionBodies(bodies: list) -> adsk.fusion.BRepBody:
+    """
+    Unions a list of temporary bodies into one and returns it (None if the list is empty)
+    adjacent pairs are merged each round, so every boolean works on similarly sized bodies
+    rather than adding one small body at a time to an ever growing result
+    """
+    tempBrepMgr = adsk.fusion.TemporaryBRepManager.get()
+    unionType = adsk.fusion.BooleanTypes.UnionBooleanType
+    while len(bodies) > 1:
+        for target, tool in zip(bodies[::2], bodies[1::2]):
+            tempBrepMgr.booleanOperation(target, tool, unionType)
+        bodies = bodies[::2]  # booleanOperation modifies the target body in place
+    return bodies[0] if bodies else None
+
 
-   
 # def getVertexAtFace(face: adsk.fusion.BRepFace, edge: adsk.fusion.BRepEdge):
 #     if edge.startVertex in face.vertices:
 #         return edge.startVertex
@@ -120,6 +198,11 @@ def getCornerEdgesAtFace(face: adsk.fusion.BRepFace, edge: adsk.fusion.BRepEdge)
 #         return edge.endVertex
 
 
+def _edgePoints(edge: adsk.fusion.BRepEdge) -> tuple:
+    """returns the edge's (start, end) vertex coordinates as plain (x, y, z) tuples"""
+    return edge.startVertex.geometry.asArray(), edge.endVertex.geometry.asArray()
+
+
 def getEdgeVector(
     edge: adsk.fusion.BRepEdge, refFace: adsk.fusion.BRepFace = None, reverse=False
 ) -> adsk.core.Vector3D:
@@ -128,16 +211,24 @@ def getEdgeVector(
     if refFace is supplied - returns vector pointing out from face vertex"""
     if refFace:
         reverse = edge.endVertex in refFace.vertices
-    startPoint, endPoint = (
-        (edge.endVertex.geometry, edge.startVertex.geometry)
+    (sx, sy, sz), (ex, ey, ez) = _edgePoints(edge)
+    return (
+        adsk.core.Vector3D.create(sx - ex, sy - ey, sz - ez)
         if reverse
-        else (edge.startVertex.geometry, edge.endVertex.geometry)
+        else adsk.core.Vector3D.create(ex - sx, ey - sy, ez - sz)
     )
-    return startPoint.vectorTo(endPoint)
 
 
-def getFaceNormal(face: adsk.fusion.BRepFace):
-    return face.evaluator.getNormalAtPoint(face.pointOnFace)[1]
+def getFaceNormal(face: adsk.fusion.BRepFace, entityToken: str = None) -> adsk.core.Vector3D:
+    """
+    returns the face normal - cached by face entityToken, so callers must not modify it
+    pass the token if it has already been read
+    """
+    if entityToken is None:
+        entityToken = face.entityToken
+    if (normal := _normalCache.get(entityToken)) is None:
+        normal = _normalCache[entityToken] = face.evaluator.getNormalAtPoint(face.pointOnFace)[1]
+    return normal
 
 
 def messageBox(*args):
@@ -149,24 +240,20 @@ def getTopFace(selectedFace: adsk.fusion.BRepFace) -> [adsk.fusion.BRepFace, ads
     Returns the top-most face of a body and a Point3D reference point on that face, based on the supplied BrepFace 
     """
     normal = getFaceNormal(selectedFace)
-    refPlane = adsk.core.Plane.create(selectedFace.vertices.item(0).geometry, normal)
-    refLine = adsk.core.InfiniteLine3D.create(
-        selectedFace.vertices.item(0).geometry, normal
-    )
-    refPoint = refPlane.intersectWithLine(refLine)
+    nx, ny, nz = normal.asArray()
+    rx, ry, rz = selectedFace.pointOnFace.asArray()
     faceList = []
     body: adsk.fusion.BRepBody = selectedFace.body
     #Create a list of parallel faces
     for face in body.faces:
         if not normal.isParallelTo(getFaceNormal(face)):
             continue #eliminate faces that aren't parallel to selectedFace
-        facePlane = adsk.core.Plane.create(face.vertices.item(0).geometry, normal)
-        intersectionPoint = facePlane.intersectWithLine(refLine)
-        directionVector = refPoint.vectorTo(intersectionPoint)
-        distance = directionVector.dotProduct(normal)
+        # face normals are unit length, so the dot product is the distance between the face planes along the normal
+        # any point on a planar face will do - pointOnFace is one call, vertices.item(0).geometry is three
+        vx, vy, vz = face.pointOnFace.asArray()
+        distance = (vx - rx) * nx + (vy - ry) * ny + (vz - rz) * nz
         faceList.append([face, distance])
-    sortedFaceList = sorted(faceList, key=lambda x: x[1]) #sort face list by ascending order of distance
-    top = sortedFaceList[-1] #top face is the face that is furthest from the selectedFace
+    top = max(faceList, key=lambda x: x[1]) #top face is the face that is furthest from the selectedFace
     refPoint = (
         top[0].nativeObject.pointOnFace
         if top[0].assemblyContext
@@ -179,16 +266,13 @@ def getTranslateVectorBetweenFaces(fromFace: adsk.fusion.BRepFace, toFace: adsk.
     '''returns absolute distance or false if failed'''
 
     normal = getFaceNormal(fromFace)
-    if not normal.isParallelTo(getFaceNormal(fromFace)):
+    if not normal.isParallelTo(getFaceNormal(toFace)):
         return False
 
-    fromFacePlane = adsk.core.Plane.create(fromFace.vertices.item(0).geometry, normal)
-    fromFaceLine = adsk.core.InfiniteLine3D.create(
-        fromFace.vertices.item(0).geometry, normal
-    )
-    fromFacePoint = fromFacePlane.intersectWithLine(fromFaceLine)
-
-    toFacePlane = adsk.core.Plane.create(toFace.vertices.item(0).geometry, normal)
-    toFacePoint = toFacePlane.intersectWithLine(fromFaceLine)
-    translateVector = fromFacePoint.vectorTo(toFacePoint)
-    return translateVector
+    # the faces are parallel - the translation is the (unit) normal scaled by the distance between their planes,
+    # measured between any point on each face
+    nx, ny, nz = normal.asArray()
+    fx, fy, fz = fromFace.pointOnFace.asArray()
+    tx, ty, tz = toFace.pointOnFace.asArray()
+    distance = (tx - fx) * nx + (ty - fy) * ny + (tz - fz) * nz
+    return adsk.core.Vector3D.create(nx * distance, ny * distance, nz * distance)
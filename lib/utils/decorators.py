@@ -155,7 +155,7 @@ def parseDecorator(func):
         """ """
         rtn = func(*_args, **_kwargs)
         cmdInputs = _args[1].inputs.command.commandInputs
-        _args[0].parseInputs(cmdInputs)  # calls self.parseInputs - needs to be better
+        _args[0].parseInputs(cmdInputs, _args[1].input)  # calls self.parseInputs - needs to be better
         logger.debug(f"notify method created: {func.__name__}")
         return rtn
 
@@ -165,12 +165,14 @@ def parseDecorator(func):
 def makeTempFaceVisible(method):
     @wraps(method)
     def wrapper(*args, **kwargs):
-        # Create a base feature
-        baseFeats = g._rootComp.features.baseFeatures
+        # Create a base feature - rootComponent is resolved per call so it follows the active document
+        design: adsk.fusion.Design = adsk.core.Application.get().activeProduct
+        rootComp = design.rootComponent
+        baseFeats = rootComp.features.baseFeatures
         baseFeat = baseFeats.add()
 
         baseFeat.startEdit()
-        bodies = g._rootComp.bRepBodies
+        bodies = rootComp.bRepBodies
 
         tempBody = method(*args, **kwargs)
         tempBody.name = f"Debug_{method.__name__}"
@@ -228,9 +230,9 @@ def tokeniseEntity(method):
 def timer(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        startTime = time.time()
+        startTime = time.perf_counter()
         result = func(*args, **kwargs)
-        logger.debug(f"{func.__name__}: time taken = {time.time() - startTime}")
+        logger.debug(f"{func.__name__}: time taken = {time.perf_counter() - startTime}")
         return result
 
     return wrapper
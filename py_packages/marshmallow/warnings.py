@@ -1,2 +0,0 @@
-class RemovedInMarshmallow4Warning(DeprecationWarning):
-    pass
@@ -0,0 +1,24 @@
+"""
+Makes the add-in importable outside Fusion 360 - the adsk modules only exist inside Fusion, so they're
+replaced by mocks, and the repository folder is imported as a package (as Fusion does with the add-in folder)
+"""
+import importlib
+import os
+import sys
+from unittest import mock
+
+adsk = sys.modules.get("adsk")
+if adsk is None:
+    adsk = mock.MagicMock()
+    for name, module in (("adsk", adsk), ("adsk.core", adsk.core), ("adsk.fusion", adsk.fusion), ("adsk.cam", adsk.cam)):
+        sys.modules[name] = module
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if os.path.dirname(_root) not in sys.path:
+    sys.path.insert(0, os.path.dirname(_root))
+_package = os.path.basename(_root)
+
+
+def load(module: str):
+    """imports an add-in module by its path inside the package, eg load("lib.utils.dbutils")"""
+    return importlib.import_module(f"{_package}.{module}")
@@ -0,0 +1,150 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from _fusion import load
+
+DbData = load("lib.classes.DbData")
+DbParams = DbData.DbParams
+
+
+class EvaluateTest(unittest.TestCase):
+    def setUp(self):
+        DbData.clearExpressionCache()
+        self.addCleanup(DbData.clearExpressionCache)
+        self.evaluator = mock.Mock(return_value=1.27)
+        application = mock.Mock()
+        application.activeProduct.unitsManager.evaluateExpression = self.evaluator
+        patcher = mock.patch.object(DbData, "_application", return_value=application)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_simple_expressions_convert_to_cm(self):
+        cases = {
+            "0.25 in": 0.635,
+            "3 mm": 0.3,
+            "1.5cm": 1.5,
+            " -2 m ": -200.0,
+            ".5 ft": 15.24,
+        }
+        for expression, expected in cases.items():
+            with self.subTest(expression=expression):
+                self.assertAlmostEqual(DbData._evaluate(expression), expected, places=12)
+        self.evaluator.assert_not_called()
+
+    def test_mm_conversion_is_exact(self):
+        self.assertEqual(DbData._evaluate("3 mm"), 0.3)
+
+    def test_other_expressions_use_fusion_evaluator(self):
+        for expression in ("5", "toolDia * 2", "3 mm + 1 mm", "1 yd"):
+            with self.subTest(expression=expression):
+                self.assertEqual(DbData._evaluate(expression), 1.27)
+                self.evaluator.assert_called_with(expression)
+
+    def test_results_are_cached_until_cleared(self):
+        DbData._evaluate("toolDia")
+        DbData._evaluate("toolDia")
+        self.assertEqual(self.evaluator.call_count, 1)
+        DbData.clearExpressionCache()
+        DbData._evaluate("toolDia")
+        self.assertEqual(self.evaluator.call_count, 2)
+
+
+class FromDefaultsTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "defaults.dat")
+        patcher = mock.patch.object(DbData, "CONFIG_PATH", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, data: bytes):
+        with open(self.path, "wb") as file:
+            file.write(data)
+
+    def _read(self) -> bytes:
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def test_missing_file_gives_built_in_defaults(self):
+        self.assertEqual(DbParams.from_defaults(), DbParams())
+
+    def test_pickle_file_is_loaded(self):
+        data = pickle.dumps(DbParams(toolDiaStr="3 mm", minimalPercent=20.0).to_dict(), pickle.HIGHEST_PROTOCOL)
+        self._write(data)
+        params = DbParams.from_defaults()
+        self.assertEqual(params.toolDiaStr, "3 mm")
+        self.assertEqual(params.minimalPercent, 20.0)
+        self.assertEqual(self._read(), data)  # nothing to migrate
+
+    def test_json_file_is_loaded_and_migrated_to_pickle(self):
+        self._write(json.dumps({"toolDiaStr": "6 mm", "longSide": False}).encode())
+        params = DbParams.from_defaults()
+        self.assertEqual(params.toolDiaStr, "6 mm")
+        self.assertFalse(params.longSide)
+        data = self._read()
+        self.assertTrue(data.startswith(DbData._PICKLE_PREFIX))
+        self.assertEqual(pickle.loads(data), params.to_dict())
+
+    def test_json_file_that_cannot_be_rewritten_is_still_loaded(self):
+        self._write(json.dumps({"toolDiaStr": "6 mm"}).encode())
+        with mock.patch.object(DbParams, "write_defaults", side_effect=OSError), self.assertLogs(DbData.logger, "WARNING"):
+            self.assertEqual(DbParams.from_defaults().toolDiaStr, "6 mm")
+
+    def test_damaged_files_give_built_in_defaults(self):
+        for data in (b"\x80\x05damaged", b"{not json"):
+            with self.subTest(data=data):
+                self._write(data)
+                with self.assertLogs(DbData.logger, "WARNING"):
+                    self.assertEqual(DbParams.from_defaults(), DbParams())
+                self.assertEqual(self._read(), data)  # left for the user to inspect or overwrite
+
+
+class CodecTest(unittest.TestCase):
+    def test_from_dict_ignores_unknown_keys_and_defaults_missing_ones(self):
+        params = DbParams.from_dict({"toolDiaStr": "3 mm", "parametric": True, "removedSetting": 1})
+        self.assertEqual(params, DbParams(toolDiaStr="3 mm"))
+
+    def test_from_dict_clamps_angles(self):
+        cases = [
+            ((-10.0, 200.0), (0.0, 180.0)),
+            ((95.0, 90.0), (95.0, 95.0)),
+            ((190.0, 10.0), (180.0, 180.0)),
+            ((80.0, 100.0), (80.0, 100.0)),
+        ]
+        for (minAngle, maxAngle), expected in cases:
+            with self.subTest(minAngleLimit=minAngle, maxAngleLimit=maxAngle):
+                params = DbParams.from_dict({"minAngleLimit": minAngle, "maxAngleLimit": maxAngle})
+                self.assertEqual((params.minAngleLimit, params.maxAngleLimit), expected)
+
+    def test_round_trip(self):
+        params = DbParams(
+            toolDiaStr="3 mm",
+            dbType="Mortise Dogbone",
+            fromTop=False,
+            toolDiaOffsetStr="0.1 mm",
+            mortiseType=True,
+            longSide=False,
+            minimalPercent=15.0,
+            acuteAngle=True,
+            obtuseAngle=True,
+            minAngleLimit=80.0,
+            maxAngleLimit=100.0,
+            logging=10,
+            benchmark=True,
+        )
+        values = params.to_dict()
+        self.assertEqual(set(values), {name for name, _, _ in DbParams.FIELDS})
+        self.assertEqual(DbParams.from_dict(values), params)
+        self.assertEqual(DbParams.from_json(params.to_json()), params)
+
+    def test_to_dict_leaves_out_derived_values(self):
+        self.assertFalse(any(name.startswith("_") for name in DbParams().to_dict()))
+
+
+if __name__ == "__main__":
+    unittest.main()
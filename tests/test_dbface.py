@@ -0,0 +1,51 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from _fusion import load
+
+DbClasses = load("lib.classes.DbClasses")
+dbutils = load("lib.utils.dbutils")
+errors = load("lib.common.errors")
+
+
+def _face(token, normal, point, parallel=True):
+    normalVector = mock.MagicMock()
+    normalVector.asArray.return_value = normal
+    normalVector.isParallelTo.return_value = parallel
+    face = mock.MagicMock()
+    face.entityToken = token
+    face.evaluator.getNormalAtPoint.return_value = (True, normalVector)
+    face.pointOnFace.asArray.return_value = point
+    return face
+
+
+def _dbFace(native):
+    dbFace = object.__new__(DbClasses.DbFace)
+    dbFace._native = native
+    dbFace._faceId = hash(native.entityToken)
+    dbFace._topFaceTranslation = None
+    return dbFace
+
+
+class TranslationToTest(unittest.TestCase):
+    def setUp(self):
+        dbutils.clearCaches()
+
+    def test_parallel_faces_translate_along_normal(self):
+        face = _face("face", (0.0, 0.0, 1.0), (1.0, 2.0, 0.5))
+        topFace = _face("top", (0.0, 0.0, 1.0), (5.0, -3.0, 2.0))
+        with mock.patch.object(
+            dbutils.adsk.core.Vector3D, "create", lambda x, y, z: SimpleNamespace(asArray=lambda: (x, y, z))
+        ):
+            self.assertEqual(_dbFace(face).translationTo(topFace), (0.0, 0.0, 1.5))
+
+    def test_non_parallel_faces_raise_topology_error(self):
+        face = _face("face", (0.0, 0.0, 1.0), (0.0, 0.0, 0.0), parallel=False)
+        topFace = _face("top", (1.0, 0.0, 0.0), (0.0, 0.0, 1.0))
+        with self.assertRaises(errors.DogboneTopologyError):
+            _dbFace(face).translationTo(topFace)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import itertools
+import math
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from _fusion import load
+
+dbutils = load("lib.utils.dbutils")
+errors = load("lib.common.errors")
+
+
+class _Vector:
+    """the Vector3D methods the original getAngleBetweenFaces used - for reference results"""
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def asArray(self):
+        return (self.x, self.y, self.z)
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def length(self):
+        return math.sqrt(self.dot(self))
+
+    def angleTo(self, other):
+        lengths = self.length() * other.length()
+        if lengths == 0:
+            return 0.0
+        return math.acos(max(-1.0, min(1.0, self.dot(other) / lengths)))
+
+    def crossProduct(self, other):
+        return _Vector(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+
+def _referenceAngle(normal1, normal2, edgeVec):
+    """getAngleBetweenFaces as it was written against Vector3D, before the plain coordinate rewrite"""
+    normalAngle = normal1.angleTo(normal2)
+    cross = normal2.crossProduct(normal1)
+    return (
+        (math.pi * 2) - (math.pi - normalAngle)
+        if edgeVec.angleTo(cross) > math.pi / 2
+        else math.pi - normalAngle
+    )
+
+
+def _unit(degrees):
+    return _Vector(math.cos(math.radians(degrees)), math.sin(math.radians(degrees)), 0.0)
+
+
+_tokens = itertools.count()
+
+
+def _planarFace(normal):
+    # a fresh token for every face - normals are cached by entityToken
+    face = mock.MagicMock()
+    face.entityToken = f"face{next(_tokens)}"
+    face.geometry.objectType = dbutils._PLANE_CLASS_TYPE
+    face.evaluator.getNormalAtPoint.return_value = (True, normal)
+    return face
+
+
+def _vertex(point):
+    vertex = mock.MagicMock()
+    vertex.geometry.asArray.return_value = point
+    return vertex
+
+
+def _edge(face1, face2, opposed, start=(0.0, 0.0, 0.0), end=(0.0, 0.0, 2.0)):
+    """a straight edge between face1 and face2 - opposed is face1's coEdge isOpposedToEdge"""
+    coEdge1 = SimpleNamespace(loop=SimpleNamespace(face=face1), isOpposedToEdge=opposed)
+    coEdge2 = SimpleNamespace(loop=SimpleNamespace(face=face2), isOpposedToEdge=not opposed)
+    edge = mock.MagicMock()
+    edge.faces = [face1, face2]
+    edge.coEdges = [coEdge2, coEdge1]
+    edge.startVertex = _vertex(start)
+    edge.endVertex = _vertex(end)
+    return edge
+
+
+class GetAngleBetweenFacesTest(unittest.TestCase):
+    def setUp(self):
+        dbutils.clearCaches()
+
+    def _angle(self, normal1, normal2, opposed):
+        edge = _edge(_planarFace(normal1), _planarFace(normal2), opposed)
+        return dbutils._getAngleBetweenFaces(edge)
+
+    def test_matches_vector3d_results(self):
+        edgeUp, edgeDown = _Vector(0.0, 0.0, 2.0), _Vector(0.0, 0.0, -2.0)
+        for degrees in (30, 60, 89, 90, 91, 120, 150):
+            for opposed in (False, True):
+                with self.subTest(degrees=degrees, opposed=opposed):
+                    normal1, normal2 = _unit(0), _unit(degrees)
+                    expected = _referenceAngle(normal1, normal2, edgeDown if opposed else edgeUp)
+                    self.assertAlmostEqual(self._angle(normal1, normal2, opposed), expected, places=12)
+
+    def test_concave_and_convex_corners(self):
+        # face1 facing +x, face2 facing +y, edge running up the z axis
+        self.assertAlmostEqual(self._angle(_unit(0), _unit(90), opposed=True), math.pi / 2)
+        self.assertAlmostEqual(self._angle(_unit(0), _unit(90), opposed=False), math.pi * 3 / 2)
+
+    def test_flat_edge(self):
+        for opposed in (False, True):
+            with self.subTest(opposed=opposed):
+                self.assertAlmostEqual(self._angle(_unit(0), _unit(0), opposed), math.pi)
+
+    def test_knife_edge(self):
+        for opposed in (False, True):
+            with self.subTest(opposed=opposed):
+                self.assertAlmostEqual(self._angle(_unit(0), _unit(180), opposed), 0.0)
+
+    def test_non_planar_face(self):
+        face1, face2 = _planarFace(_unit(0)), _planarFace(_unit(90))
+        face2.geometry.objectType = "adsk::core::Cylinder"
+        self.assertEqual(dbutils._getAngleBetweenFaces(_edge(face1, face2, opposed=True)), 0)
+
+    def test_cached_by_entity_token(self):
+        edge = _edge(_planarFace(_unit(0)), _planarFace(_unit(90)), opposed=True)
+        angle = dbutils.getAngleBetweenFaces(edge, "edge")
+        edge.coEdges = []  # a second evaluation would fail
+        self.assertEqual(dbutils.getAngleBetweenFaces(edge, "edge"), angle)
+
+
+class IsLikelyCornerEdgeTest(unittest.TestCase):
+    def setUp(self):
+        dbutils.clearCaches()
+
+    def _likely(self, cornerDegrees, minAngle, maxAngle):
+        # an inside corner of cornerDegrees has face normals (180 - cornerDegrees) apart
+        face1 = _planarFace(_unit(0))
+        face2 = _planarFace(_unit(180 - cornerDegrees))
+        cosLow, cosHigh = math.cos(math.radians(minAngle)), math.cos(math.radians(maxAngle))
+        return dbutils.isLikelyCornerEdge(face1, face2, cosLow, cosHigh)
+
+    def test_right_angle_window(self):
+        self.assertTrue(self._likely(90, 90, 90))
+        self.assertTrue(self._likely(90, 89, 91))
+        self.assertFalse(self._likely(95, 89, 91))
+        self.assertFalse(self._likely(85, 89, 91))
+
+    def test_acute_window(self):
+        self.assertTrue(self._likely(60, 60, 90))
+        self.assertTrue(self._likely(75, 60, 90))
+        self.assertFalse(self._likely(59, 60, 90))
+        self.assertFalse(self._likely(91, 60, 90))
+
+    def test_obtuse_window(self):
+        self.assertTrue(self._likely(120, 90, 120))
+        self.assertTrue(self._likely(105, 90, 120))
+        self.assertFalse(self._likely(121, 90, 120))
+        self.assertFalse(self._likely(89, 90, 120))
+
+    def test_margin(self):
+        # a little under 1e-4 on the cosine past either limit still passes - the exact angle test follows
+        self.assertTrue(self._likely(90.005, 60, 90))
+        self.assertTrue(self._likely(59.995, 60, 90))
+        self.assertFalse(self._likely(90.01, 60, 90))
+        self.assertFalse(self._likely(59.99, 60, 90))
+
+
+def _topologyEdge(tempId):
+    return SimpleNamespace(tempId=tempId)
+
+
+class GetCornerEdgesAtFaceTest(unittest.TestCase):
+    def _corner(self, vertexEdgeIds, faceEdgeIds):
+        vertex = SimpleNamespace(edges=[_topologyEdge(i) for i in vertexEdgeIds])
+        face = mock.MagicMock()
+        face.vertices = [vertex]
+        face.edges = [_topologyEdge(i) for i in faceEdgeIds]
+        edge = SimpleNamespace(startVertex=vertex, endVertex=SimpleNamespace())
+        return face, edge
+
+    def test_returns_the_two_face_edges_at_the_corner(self):
+        face, edge = self._corner([1, 2, 3], [2, 3, 4, 5])
+        self.assertEqual(sorted(e.tempId for e in dbutils.getCornerEdgesAtFace(face, edge)), [2, 3])
+
+    def test_uses_end_vertex_when_start_is_off_the_face(self):
+        face, edge = self._corner([1, 2, 3], [2, 3, 4, 5])
+        edge.startVertex, edge.endVertex = edge.endVertex, edge.startVertex
+        self.assertEqual(len(dbutils.getCornerEdgesAtFace(face, edge)), 2)
+
+    def test_vertex_with_too_few_edges(self):
+        face, edge = self._corner([1, 2], [2, 3, 4])
+        with self.assertRaises(errors.DogboneTopologyError):
+            dbutils.getCornerEdgesAtFace(face, edge)
+
+    def test_wrong_number_of_common_edges(self):
+        for faceEdgeIds in ([2, 4, 5], [1, 2, 3], [4, 5, 6]):
+            with self.subTest(faceEdgeIds=faceEdgeIds):
+                face, edge = self._corner([1, 2, 3], faceEdgeIds)
+                with self.assertRaises(errors.DogboneTopologyError):
+                    dbutils.getCornerEdgesAtFace(face, edge)
+
+    def test_supplied_face_edge_index_is_used(self):
+        face, edge = self._corner([1, 2, 3], [])
+        faceEdges = {i: _topologyEdge(i) for i in (2, 3, 4)}
+        self.assertEqual(len(dbutils.getCornerEdgesAtFace(face, edge, faceEdges)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import logging
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from _fusion import load
+
+DogboneUi = load("lib.classes.DogboneUi")
+DbData = load("lib.classes.DbData")
+DbClasses = load("lib.classes.DbClasses")
+constants = load("constants")
+
+
+def _emptySelectionInput():
+    return SimpleNamespace(selectionCount=0, selection=None)
+
+
+def _dialog(loggingLevel):
+    """a dialog with just the state parseInputs reads - building the real one needs a Fusion command"""
+    ui = object.__new__(DogboneUi.DogboneUi)
+    ui.param = DbData.DbParams(logging=loggingLevel)
+    ui.selection = DbClasses.Selection()
+    ui.edgeSelectInput = _emptySelectionInput()
+    ui.faceSelectInput = _emptySelectionInput()
+    return ui
+
+
+class ParseInputsLoggingTest(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("dogbone")
+        self.addCleanup(self.logger.setLevel, self.logger.level)
+
+    def test_selection_change_sets_stored_logging_level(self):
+        for inputId in (constants.FACE_SELECT, constants.EDGE_SELECT):
+            with self.subTest(inputId=inputId):
+                self.logger.setLevel(logging.WARNING)
+                ui = _dialog(logging.DEBUG)
+                with mock.patch.object(DogboneUi.DogboneUi, "parseSettings") as parseSettings:
+                    ui.parseInputs([], SimpleNamespace(id=inputId))
+                parseSettings.assert_not_called()
+                self.assertEqual(self.logger.level, logging.DEBUG)
+
+
+class ModeTest(unittest.TestCase):
+    def test_unknown_type_hides_type_specific_inputs(self):
+        ui = _dialog(logging.NOTSET)
+        ui.param.dbType = "Stale Dogbone"
+        ui.inputs = mock.MagicMock()
+        ui.mode()
+        self.assertFalse(ui.mortiseTypeInput.isVisible)
+        self.assertFalse(ui.minimalPercentInput.isVisible)
+
+
+if __name__ == "__main__":
+    unittest.main()